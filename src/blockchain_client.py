@@ -3,19 +3,78 @@ Blockchain client module.
 Handles Web3 connections and blockchain interactions via Alchemy API.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import random
+import re
 import threading
 import time
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Union, Callable
 from decimal import Decimal
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from eth_abi import encode, decode
 from web3 import Web3
 from web3.contract import Contract
+from web3.exceptions import TransactionNotFound, TimeExhausted
 from eth_account import Account
+from eth_account.datastructures import SignedTransaction
 from eth_account.signers.local import LocalAccount
 
 logger = logging.getLogger(__name__)
 
+# Function selector for ERC-20 balanceOf(address)
+BALANCE_OF_SELECTOR = '0x70a08231'
+
+# Function selector for ERC-20 transfer(address,uint256)
+TRANSFER_SELECTOR = bytes.fromhex('a9059cbb')
+
+# Function selector for ERC-20 decimals()
+DECIMALS_SELECTOR = '0x313ce567'
+
+# Multicall3 contract (deployed at the same address on all supported chains)
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+# Function selector for Multicall3 aggregate3((address,bool,bytes)[])
+MULTICALL_AGGREGATE3_SELECTOR = '0x82ad56cb'
+
+# Receipt polling backoff (seconds): starts at the initial delay, doubles up to the cap
+RECEIPT_POLL_INITIAL = 0.5
+RECEIPT_POLL_MAX = 4.0
+RECEIPT_HEAD_POLL = 0.25
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 4.0
+NONCE_RESYNC_EVERY = 20  # Re-check the chain's pending nonce after this many local reservations
+
+# Lifetime of cached gas price / fee parameters (seconds); about half an
+# Ethereum block, so orders sent in a burst share one fee lookup
+FEE_CACHE_TTL = 6.0
+
+# Maximum number of calls packed into a single JSON-RPC batch request
+RPC_BATCH_SIZE = 100
+RPC_BATCH_CONCURRENCY = 4  # Batch POSTs in flight at once
+
+# Token amount accepted by order/transfer methods (whole tokens, not base units)
+Amount = Union[Decimal, int, float]
+
+# Error classification (substring match, case-insensitive)
+_NONCE_RE = re.compile(r'nonce|transaction underpriced', re.IGNORECASE)
+# Node already has the transaction in its mempool (a resend of an accepted send)
+_ALREADY_KNOWN_RE = re.compile(r'already known|known transaction|already imported', re.IGNORECASE)
+_NET_RE = re.compile(r'connection|timeout|reset|refused|unreachable', re.IGNORECASE)
+_BALANCE_RE = re.compile(r'exceeds balance|insufficient balance', re.IGNORECASE)
+
+# Signed transaction bytes attribute: raw_transaction (eth-account >= 0.12) or rawTransaction
+_RAW_TX_ATTR = 'raw_transaction' if hasattr(SignedTransaction, 'raw_transaction') else 'rawTransaction'
+
+# Memoized address checksumming (keccak256 per call otherwise)
+_checksum = functools.lru_cache(maxsize=4096)(Web3.to_checksum_address)
+
 # ERC-20 ABI (minimal, for token operations)
 ERC20_ABI = [
     {
@@ -52,10 +111,262 @@ ERC20_ABI = [
 ]
 
 
+def _encode_memo(memo: dict) -> bytes:
+    """
+    Serialize an order memo to compact JSON bytes.
+    
+    Uses orjson when possible; falls back to stdlib json for memos holding
+    integers wider than 64 bits (18-decimal wei amounts), which orjson rejects.
+    
+    Args:
+        memo: Memo dict
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    try:
+        return orjson.dumps(memo)
+    except TypeError:
+        return json.dumps(memo, separators=(',', ':')).encode('utf-8')
+
+
+# HTTP transport settings for the shared RPC session
+HTTP_TRANSPORT_OPTIONS = {
+    'pool_connections': 50,  # Connection pools (one per host)
+    'pool_maxsize': 100,  # Keep-alive connections per pool
+    'retries': 3,  # Retries on 429/5xx gateway errors
+    'backoff_factor': 0.3,
+    'timeout': 30,  # Seconds per request
+}
+
+# HTTP providers shared across clients:
+# rpc_url -> (HTTPProvider, requests.Session, send requests.Session without retries)
+_PROVIDER_CACHE: Dict[str, tuple] = {}
+_PROVIDER_CACHE_LOCK = threading.Lock()
+
+
+def _make_session(retries: int = None) -> requests.Session:
+    """
+    Create an HTTP session with a pooled keep-alive adapter.
+    
+    Retries rate-limited (429) and gateway errors with a short backoff.
+    POST is included since every JSON-RPC call is a POST. Sessions that
+    broadcast signed transactions must be created with retries=0: a gateway
+    error doesn't mean the node rejected the transaction, and a resend can
+    fail with "already known" for a transaction that was accepted.
+    
+    Args:
+        retries: Transport retries (defaults to HTTP_TRANSPORT_OPTIONS['retries'])
+    
+    Returns:
+        Configured requests.Session
+    """
+    if retries is None:
+        retries = HTTP_TRANSPORT_OPTIONS['retries']
+    retry = Retry(
+        total=retries,
+        backoff_factor=HTTP_TRANSPORT_OPTIONS['backoff_factor'],
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST'])
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_TRANSPORT_OPTIONS['pool_connections'],
+        pool_maxsize=HTTP_TRANSPORT_OPTIONS['pool_maxsize'],
+        max_retries=retry
+    )
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _get_http_provider(rpc_url: str) -> tuple:
+    """
+    Get the shared HTTP provider for an RPC URL, creating it on first use.
+    
+    Args:
+        rpc_url: RPC endpoint URL
+        
+    Returns:
+        Tuple of (HTTPProvider, requests.Session, requests.Session for
+        eth_sendRawTransaction without transport retries)
+    """
+    with _PROVIDER_CACHE_LOCK:
+        entry = _PROVIDER_CACHE.get(rpc_url)
+        if entry is None:
+            session = _make_session()
+            provider = Web3.HTTPProvider(
+                rpc_url, session=session,
+                request_kwargs={'timeout': HTTP_TRANSPORT_OPTIONS['timeout']}
+            )
+            entry = (provider, session, _make_session(retries=0))
+            _PROVIDER_CACHE[rpc_url] = entry
+        return entry
+
+
+class NonceManager:
+    """
+    Hands out transaction nonces per address.
+    
+    Each address's counter is read from the chain once ('pending' block) and
+    then incremented locally under a per-address lock, so senders on different
+    addresses never wait on each other. Every resync_every reservations the
+    pending nonce is re-read, and the counter jumps ahead if transactions were
+    sent from the address outside this process.
+    """
+    
+    def __init__(self, fetch_nonce: Callable[[str, str], int],
+                 resync_every: int = NONCE_RESYNC_EVERY):
+        """
+        Initialize nonce manager.
+        
+        Args:
+            fetch_nonce: Function (address, block) -> transaction count from chain
+            resync_every: Local reservations between chain checks
+        """
+        self._fetch_nonce = fetch_nonce
+        self._resync_every = resync_every
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_mutex = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._issued: Dict[str, int] = {}  # Reservations since the last chain sync
+    
+    def lock_for(self, address: str) -> threading.Lock:
+        """
+        Get the lock guarding an address's counter, creating it on first use.
+        
+        Args:
+            address: Checksum address
+            
+        Returns:
+            Per-address lock
+        """
+        lock = self._locks.get(address)
+        if lock is None:
+            with self._locks_mutex:
+                lock = self._locks.setdefault(address, threading.Lock())
+        return lock
+    
+    def reserve(self, address: str, block: str = 'pending') -> int:
+        """
+        Reserve the next nonce for an address.
+        
+        Args:
+            address: Checksum address
+            block: Block tag used when syncing from chain
+            
+        Returns:
+            Nonce to use for the next transaction
+        """
+        with self.lock_for(address):
+            nonce = self._counters.get(address)
+            if nonce is None:
+                nonce = self._fetch_nonce(address, block)
+                self._issued[address] = 0
+                logger.debug(f"Nonce for {address} synced from chain: {nonce} ({block})")
+            elif self._issued.get(address, 0) >= self._resync_every:
+                nonce = self._check_chain(address, nonce)
+            
+            self._counters[address] = nonce + 1
+            self._issued[address] = self._issued.get(address, 0) + 1
+            return nonce
+    
+    def _check_chain(self, address: str, nonce: int) -> int:
+        """
+        Re-read the pending nonce and move ahead if the chain is past our counter.
+        Must be called with the address's lock held.
+        
+        Args:
+            address: Checksum address
+            nonce: Next nonce according to the local counter
+            
+        Returns:
+            Nonce to use for the next transaction
+        """
+        try:
+            chain_nonce = self._fetch_nonce(address, 'pending')
+        except Exception as e:
+            logger.debug(f"Nonce check failed for {address}, keeping local counter: {e}")
+            return nonce
+        
+        self._issued[address] = 0
+        if chain_nonce > nonce:
+            logger.info(f"Nonce for {address} behind chain ({nonce} < {chain_nonce}), skipping ahead")
+            return chain_nonce
+        return nonce
+    
+    def is_synced(self, address: str) -> bool:
+        """
+        Check whether an address's counter has been initialized.
+        
+        Args:
+            address: Checksum address
+            
+        Returns:
+            True if reserve() can be served without a chain lookup
+        """
+        return address in self._counters
+    
+    def seed(self, address: str, nonce: int):
+        """
+        Initialize an address's counter from an externally fetched chain nonce.
+        Ignored if the counter is already initialized.
+        
+        Args:
+            address: Checksum address
+            nonce: Pending transaction count from chain
+        """
+        with self.lock_for(address):
+            if address not in self._counters:
+                self._counters[address] = nonce
+                self._issued[address] = 0
+    
+    def release_and_resync(self, address: str) -> Optional[int]:
+        """
+        Resync an address's counter from chain after a failed transaction.
+        
+        If the chain can't be reached, the counter is dropped and resynced
+        lazily on the next reserve().
+        
+        Args:
+            address: Checksum address
+            
+        Returns:
+            Pending nonce from chain, or None if it could not be fetched
+        """
+        with self.lock_for(address):
+            try:
+                nonce = self._fetch_nonce(address, 'pending')
+            except Exception as e:
+                logger.debug(f"Nonce resync failed for {address}: {e}")
+                self._counters.pop(address, None)
+                return None
+            
+            self._counters[address] = nonce
+            self._issued[address] = 0
+            logger.debug(f"Nonce for {address} resynced from chain: {nonce}")
+            return nonce
+    
+    def reset(self, address: str = None):
+        """
+        Forget the counter for an address (or all addresses).
+        
+        Args:
+            address: Checksum address, or None to reset all
+        """
+        if address is None:
+            self._counters.clear()
+            return
+        
+        with self.lock_for(address):
+            self._counters.pop(address, None)
+
+
 class BlockchainClient:
     """Web3 blockchain client using Alchemy API."""
     
-    def __init__(self, rpc_url: str, chain_config: dict, config=None):
+    def __init__(self, rpc_url: str, chain_config: dict, config=None, ws_url: str = None):
         """
         Initialize blockchain client.
         
@@ -63,35 +374,116 @@ class BlockchainClient:
             rpc_url: RPC endpoint URL (Alchemy)
             chain_config: Chain configuration dict
             config: Optional Config instance for accessing gas cost estimates
+            ws_url: Optional WebSocket endpoint used for receipt polling
         """
         self.rpc_url = rpc_url
         self.chain_config = chain_config
         self.config = config  # Store config for gas cost estimates
         self.chain_id = chain_config['chain_id']
-        self.usdc_address = Web3.to_checksum_address(chain_config['usdc_address'])
+        self.usdc_address = _checksum(chain_config['usdc_address'])
         self.native_token = chain_config['native_token']
         
-        # Initialize Web3
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        # Fields shared by every transaction we build (fee fields come from preflight)
+        self._tx_defaults = {'chainId': self.chain_id, 'value': 0}
         
-        if not self.w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {rpc_url}")
+        # Initialize Web3 with the provider (and keep-alive session) shared by
+        # all clients for this RPC URL; the session also carries JSON-RPC batches
+        provider, self._session, self._send_session = _get_http_provider(rpc_url)
+        self.w3 = Web3(provider)
         
-        logger.info(f"Connected to {chain_config['name']} (Chain ID: {self.chain_id})")
+        # Optional persistent WebSocket connection for receipt polling
+        # (batched JSON-RPC requests always go over HTTP)
+        self.ws_w3 = self._connect_websocket(ws_url) if ws_url else None
+        self._receipt_w3 = self.ws_w3 or self.w3
         
-        # Initialize USDC contract
-        self.usdc_contract = self.w3.eth.contract(
-            address=self.usdc_address,
-            abi=ERC20_ABI
-        )
+        # Get USDC decimals (first RPC call; doubles as the connectivity check)
+        try:
+            self.usdc_decimals = self._call_decimals(self.usdc_address)
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to {rpc_url}: {e}") from e
         
-        # Get USDC decimals
-        self.usdc_decimals = self.usdc_contract.functions.decimals().call()
+        logger.info(f"Connected to {chain_config['name']} (Chain ID: {self.chain_id})")
         logger.info(f"USDC contract loaded: {self.usdc_address} (decimals: {self.usdc_decimals})")
+        self._usdc_scale = 10 ** self.usdc_decimals
+        self._scale_18 = 10 ** 18  # Native token (wei)
+        self._stock_scale = 10 ** 18  # Stock tokens always use 18 decimals
+        self._dust_scale = 10 ** 6  # Sell amounts are truncated to this granularity
+        
+        # Guards the token contract and decimals caches (balance lookups run on worker threads)
+        self._token_cache_lock = threading.Lock()
+        
+        # Token contract instances by checksum address
+        # (built on first use; the hot paths encode calldata without them)
+        self._contract_cache: Dict[str, Contract] = {}
+        
+        # Whether an address has contract code (checksum address -> bool)
+        self._code_cache: Dict[str, bool] = {}
+        
+        # Token decimals cache (decimals are immutable, so entries never expire)
+        self._decimals_cache: Dict[str, int] = {self.usdc_address: self.usdc_decimals}
+        
+        # Short-lived balance cache: (address, token) -> (balance, timestamp)
+        # Token is 'native' for the chain's native token
+        self._balance_cache: Dict[tuple, tuple] = {}
+        self._balance_cache_ttl = chain_config.get('balance_cache_ttl', 2.0)
+        
+        # Gas price / fee parameter cache lifetime (seconds); per-chain override
+        self._fee_cache_ttl = chain_config.get('fee_cache_ttl', FEE_CACHE_TTL)
+        
+        # Upper bound on the receipt polling backoff; tuned to block time per chain
+        self._receipt_poll_max = chain_config.get('receipt_poll_interval', RECEIPT_POLL_MAX)
+        
+        # Backoff between transfer retries (seconds)
+        self._retry_base_delay = chain_config.get('retry_base_delay', RETRY_BASE_DELAY)
+        self._retry_max_delay = chain_config.get('retry_max_delay', RETRY_MAX_DELAY)
+        
+        # LocalAccount instances keyed by SHA-256 of the private key
+        self._account_cache: Dict[bytes, LocalAccount] = {}
         
         # Nonce management for preventing conflicts
-        self._nonce_lock = threading.Lock()
-        self._nonce_cache: Dict[str, int] = {}  # address -> next nonce
+        self.nonces = NonceManager(
+            lambda address, block: int(self._rpc('eth_getTransactionCount', [address, block]), 16)
+        )
+        
+        # Short-lived gas price / fee caches: (value, timestamp)
+        self._gas_price_cache: Optional[tuple] = None
+        self._fee_cache: Optional[tuple] = None
+        
+        # Whether the chain supports EIP-1559 (None until the first block is seen)
+        self._supports_1559: Optional[bool] = None
+        
+        # Set once the batched preflight has failed and fallen back (warn only once)
+        self._preflight_batch_warned = False
+        
+        # Worker pool for overlapping independent RPC calls
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='rpc')
+        
+        # Separate pool for batch chunks, so batches issued from _executor
+        # workers can't deadlock waiting on their own pool; its size also caps
+        # how many batch POSTs hit the provider at once
+        self._batch_executor = ThreadPoolExecutor(max_workers=RPC_BATCH_CONCURRENCY, thread_name_prefix='rpc-batch')
+    
+    def _connect_websocket(self, ws_url: str) -> Optional[Web3]:
+        """
+        Open a WebSocket Web3 connection, falling back to HTTP on failure.
+        
+        Args:
+            ws_url: WebSocket endpoint URL
+            
+        Returns:
+            Web3 instance over WebSocket, or None if unavailable
+        """
+        try:
+            # Support both new (LegacyWebSocketProvider) and old (WebsocketProvider) web3.py versions
+            provider_class = getattr(Web3, 'LegacyWebSocketProvider', None) or getattr(Web3, 'WebsocketProvider')
+            ws_w3 = Web3(provider_class(ws_url))
+            if ws_w3.is_connected():
+                logger.info("WebSocket connection established for receipt polling")
+                return ws_w3
+            logger.warning("WebSocket connection failed, using HTTP for receipt polling")
+        except Exception as e:
+            logger.warning(f"WebSocket unavailable ({e}), using HTTP for receipt polling")
+        return None
     
     def create_account(self) -> tuple[str, str]:
         """
@@ -107,69 +499,65 @@ class BlockchainClient:
         """
         Get account from private key.
         
+        Accounts are cached so the key is only derived once. The cache is keyed
+        by a SHA-256 digest so raw keys are not kept as dictionary keys.
+        
         Args:
             private_key: Private key hex string
             
         Returns:
             LocalAccount instance
         """
-        return Account.from_key(private_key)
+        key_bytes = private_key.encode() if isinstance(private_key, str) else bytes(private_key)
+        cache_key = hashlib.sha256(key_bytes).digest()
+        
+        account = self._account_cache.get(cache_key)
+        if account is None:
+            account = Account.from_key(private_key)
+            self._account_cache[cache_key] = account
+        return account
     
     def get_nonce(self, address: str, pending: bool = True) -> int:
         """
         Get transaction nonce for an address with caching to prevent conflicts.
         Thread-safe for concurrent transactions from same address.
         
+        The nonce is read from the chain only the first time an address is used
+        (or after a resync), then incremented locally by the NonceManager, so several
+        transactions can be sent back-to-back without waiting for each to be mined.
+        
         Args:
             address: Wallet address
-            pending: If True, include pending transactions (recommended)
+            pending: If True, include pending transactions when syncing (recommended)
             
         Returns:
             Next nonce to use
         """
-        checksum_address = Web3.to_checksum_address(address)
+        checksum_address = _checksum(address)
         
-        with self._nonce_lock:
-            try:
-                # Get current nonce from blockchain
-                if pending:
-                    chain_nonce = self.w3.eth.get_transaction_count(checksum_address, 'pending')
-                else:
-                    chain_nonce = self.w3.eth.get_transaction_count(checksum_address)
-                
-                # Get cached nonce (if exists)
-                cached_nonce = self._nonce_cache.get(checksum_address, 0)
-                
-                # Use the higher of chain nonce or cached nonce
-                nonce = max(chain_nonce, cached_nonce)
-                
-                # Update cache for next transaction
-                self._nonce_cache[checksum_address] = nonce + 1
-                
-                logger.debug(f"Nonce for {address}: {nonce} (chain={chain_nonce}, cached={cached_nonce}, pending={pending})")
-                return nonce
-                
-            except Exception as e:
-                logger.error(f"Failed to get nonce for {address}: {e}")
-                raise
+        try:
+            nonce = self.nonces.reserve(checksum_address, 'pending' if pending else 'latest')
+        except Exception as e:
+            logger.error(f"Failed to get nonce for {address}: {e}")
+            raise
+        
+        logger.debug(f"Nonce for {address}: {nonce}")
+        return nonce
     
     def reset_nonce_cache(self, address: str = None):
         """
         Reset nonce cache for an address (or all addresses).
-        Useful when transactions fail and need to resync with blockchain.
+        The next transaction resyncs with the blockchain.
         
         Args:
             address: Specific address to reset, or None to reset all
         """
-        with self._nonce_lock:
-            if address:
-                checksum_address = Web3.to_checksum_address(address)
-                if checksum_address in self._nonce_cache:
-                    del self._nonce_cache[checksum_address]
-                    logger.debug(f"Reset nonce cache for {address}")
-            else:
-                self._nonce_cache.clear()
-                logger.debug("Reset all nonce caches")
+        if address:
+            self.nonces.reset(_checksum(address))
+            logger.debug(f"Reset nonce cache for {address}")
+        else:
+            self.nonces.reset()
+            logger.debug("Reset all nonce caches")
     
     def _is_nonce_error(self, error: Exception) -> bool:
         """
@@ -181,9 +569,91 @@ class BlockchainClient:
         Returns:
             True if error is nonce-related
         """
-        error_msg = str(error).lower()
-        nonce_keywords = ['nonce', 'transaction underpriced', 'replacement transaction underpriced']
-        return any(keyword in error_msg for keyword in nonce_keywords)
+        return self._classify_nonce_error(error) != 'other'
+    
+    def _classify_nonce_error(self, error: Exception) -> str:
+        """
+        Classify a send error for the transfer retry loops.
+        
+        Args:
+            error: Exception to check
+            
+        Returns:
+            'retry' for stale-nonce errors a resync fixes (nonce too low,
+            replacement underpriced), 'other' if not nonce-related.
+            "Already known" never gets here; _send_raw_transaction treats it
+            as submitted.
+        """
+        message = str(error)
+        if _NONCE_RE.search(message):
+            return 'retry'
+        return 'other'
+    
+    def _is_balance_error(self, error: Exception) -> bool:
+        """
+        Check if an error is a token transfer reverting for insufficient balance.
+        
+        Args:
+            error: Exception to check
+            
+        Returns:
+            True if the transfer would exceed the sender's balance
+        """
+        return bool(_BALANCE_RE.search(str(error)))
+    
+    def _get_cached_balance(self, address: str, token: str) -> Optional[float]:
+        """
+        Get a balance from the short-lived cache.
+        
+        Args:
+            address: Checksum wallet address
+            token: Checksum token address, or 'native'
+            
+        Returns:
+            Cached balance, or None if missing or expired
+        """
+        entry = self._balance_cache.get((address, token))
+        if entry and time.monotonic() - entry[1] < self._balance_cache_ttl:
+            return entry[0]
+        return None
+    
+    def _set_cached_balance(self, address: str, token: str, balance: float):
+        """Store a balance in the short-lived cache."""
+        self._balance_cache[(address, token)] = (balance, time.monotonic())
+    
+    def invalidate_balance(self, address: str = None):
+        """
+        Drop cached balances for an address (or all addresses).
+        Called after transactions that move funds so the next lookup hits the chain.
+        
+        Args:
+            address: Wallet address to invalidate, or None to clear the whole cache
+        """
+        if address is None:
+            self._balance_cache.clear()
+            return
+        
+        checksum_address = _checksum(address)
+        for key in [key for key in self._balance_cache if key[0] == checksum_address]:
+            self._balance_cache.pop(key, None)
+    
+    def _raw_balance_of(self, token_address: str, address: str) -> int:
+        """
+        Call ERC-20 balanceOf with hand-built calldata (no contract wrapper).
+        
+        Sent as a raw eth_call, so web3's request/result formatters are skipped
+        and the hex result is decoded directly.
+        
+        Args:
+            token_address: Checksum token contract address
+            address: Checksum wallet address
+            
+        Returns:
+            Raw token balance (smallest units)
+        """
+        data = BALANCE_OF_SELECTOR + address[2:].lower().rjust(64, '0')
+        result = self._rpc('eth_call', [{'to': token_address, 'data': data}, 'latest'])
+        return int(result, 16) if result not in ('0x', '', None) else 0
     
     def get_native_balance(self, address: str, max_retries: int = 3) -> float:
         """
@@ -196,28 +666,25 @@ class BlockchainClient:
         Returns:
             Balance in native token
         """
-        checksum_address = Web3.to_checksum_address(address)
+        checksum_address = _checksum(address)
         
-        for attempt in range(1, max_retries + 1):
-            try:
-                balance_wei = self.w3.eth.get_balance(checksum_address)
-                balance = self.w3.from_wei(balance_wei, 'ether')
-                return float(balance)
-            except Exception as e:
-                error_msg = str(e).lower()
-                is_network_error = any(keyword in error_msg for keyword in [
-                    'connection', 'timeout', 'reset', 'refused', 'unreachable'
-                ])
-                
-                if is_network_error and attempt < max_retries:
-                    logger.warning(f"[Attempt {attempt}/{max_retries}] Network error getting balance for {address}, retrying...")
-                    time.sleep(1)
-                    continue
-                
-                logger.error(f"Failed to get native balance for {address}: {e}")
-                return 0.0
+        cached = self._get_cached_balance(checksum_address, 'native')
+        if cached is not None:
+            return cached
+        
+        try:
+            balance_wei = self._retry_rpc(
+                lambda: int(self._rpc('eth_getBalance', [checksum_address, 'latest']), 16),
+                max_retries=max_retries,
+                description=f"Getting balance for {address}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to get native balance for {address}: {e}")
+            return 0.0
         
-        return 0.0
+        balance = balance_wei / self._scale_18
+        self._set_cached_balance(checksum_address, 'native', balance)
+        return balance
     
     def get_usdc_balance(self, address: str, max_retries: int = 3) -> float:
         """
@@ -230,28 +697,466 @@ class BlockchainClient:
         Returns:
             USDC balance
         """
-        checksum_address = Web3.to_checksum_address(address)
+        checksum_address = _checksum(address)
+        
+        cached = self._get_cached_balance(checksum_address, self.usdc_address)
+        if cached is not None:
+            return cached
+        
+        try:
+            balance_raw = self._retry_rpc(
+                self._raw_balance_of, self.usdc_address, checksum_address,
+                max_retries=max_retries,
+                description=f"Getting USDC balance for {address}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to get USDC balance for {address}: {e}")
+            return 0.0
+        
+        balance = balance_raw / self._usdc_scale
+        self._set_cached_balance(checksum_address, self.usdc_address, balance)
+        return balance
+    
+    @staticmethod
+    def _is_transient_error(error: Exception, pattern: re.Pattern = _NET_RE) -> bool:
+        """
+        Check if an error is worth retrying.
         
+        HTTP errors are judged by status code (429 and 5xx are transient);
+        anything else by matching the error message against the pattern.
+        
+        Args:
+            error: Exception to check
+            pattern: Regex matched against the error message
+            
+        Returns:
+            True if the call should be retried
+        """
+        status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+        if status_code is not None:
+            return status_code == 429 or status_code >= 500
+        return bool(pattern.search(str(error)))
+    
+    def _retry_rpc(self, fn: Callable, *args, max_retries: int = 3,
+                   on_error: re.Pattern = _NET_RE, description: str = "RPC call") -> Any:
+        """
+        Call fn(*args), retrying transient errors with exponential backoff and jitter.
+        
+        Args:
+            fn: Function to call
+            *args: Arguments passed to fn
+            max_retries: Maximum number of attempts
+            on_error: Regex identifying retryable error messages
+            description: Operation description for log messages
+            
+        Returns:
+            Result of fn
+            
+        Raises:
+            Exception: The last error if it is not transient or attempts are exhausted
+        """
         for attempt in range(1, max_retries + 1):
             try:
-                balance_raw = self.usdc_contract.functions.balanceOf(checksum_address).call()
-                balance = balance_raw / (10 ** self.usdc_decimals)
-                return float(balance)
+                return fn(*args)
             except Exception as e:
-                error_msg = str(e).lower()
-                is_network_error = any(keyword in error_msg for keyword in [
-                    'connection', 'timeout', 'reset', 'refused', 'unreachable'
-                ])
+                if attempt >= max_retries or not self._is_transient_error(e, on_error):
+                    raise
                 
-                if is_network_error and attempt < max_retries:
-                    logger.warning(f"[Attempt {attempt}/{max_retries}] Network error getting USDC balance for {address}, retrying...")
-                    time.sleep(1)
-                    continue
-                
-                logger.error(f"Failed to get USDC balance for {address}: {e}")
-                return 0.0
+                delay = min(2 ** (attempt - 1), 8) + random.uniform(0, 0.5)
+                logger.warning(f"[Attempt {attempt}/{max_retries}] {description} failed ({e}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+    
+    def _rpc(self, method: str, params: list) -> Any:
+        """
+        Send a single JSON-RPC request straight to the provider.
+        
+        Bypasses web3's middleware and result formatters for hot-path calls;
+        results are returned as raw JSON values (hex strings for quantities).
+        
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+            
+        Returns:
+            Raw 'result' field of the response
+            
+        Raises:
+            ValueError: If the node returned an error
+        """
+        response = self.w3.provider.make_request(method, params)
+        if 'error' in response:
+            error = response['error']
+            raise ValueError(error.get('message', error) if isinstance(error, dict) else error)
+        return response['result']
+    
+    def _send_raw_transaction(self, raw_tx: bytes) -> str:
+        """
+        Broadcast a signed transaction with eth_sendRawTransaction.
+        
+        Uses the send session, which never retries at the transport level;
+        a resend after a gateway error is left to the caller's nonce handling.
+        If the node reports the transaction as already known, it is in the
+        mempool and the locally computed hash is returned so the caller waits
+        for its receipt as usual.
+        
+        Args:
+            raw_tx: Signed transaction bytes
+            
+        Returns:
+            Transaction hash (hex)
+            
+        Raises:
+            ValueError: If the node returned an error
+        """
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_sendRawTransaction",
+                   "params": [Web3.to_hex(raw_tx)]}
+        response = self._send_session.post(
+            self.rpc_url,
+            data=orjson.dumps(payload),
+            headers={'Content-Type': 'application/json'},
+            timeout=HTTP_TRANSPORT_OPTIONS['timeout']
+        )
+        response.raise_for_status()
+        item = orjson.loads(response.content)
+        if 'error' in item:
+            error = item['error']
+            message = error.get('message', error) if isinstance(error, dict) else error
+            if _ALREADY_KNOWN_RE.search(str(message)):
+                tx_hash = Web3.to_hex(Web3.keccak(raw_tx))
+                logger.info(f"Transaction already known to node, treating as submitted: {tx_hash}")
+                return tx_hash
+            raise ValueError(message)
+        return item['result']
+    
+    def _rpc_batch(self, calls: List[tuple], return_errors: bool = False) -> List[Any]:
+        """
+        Send JSON-RPC calls as batch requests (at most RPC_BATCH_SIZE calls per POST).
+        
+        When the calls span several batches, the POSTs are sent concurrently
+        (up to RPC_BATCH_CONCURRENCY at a time).
+        
+        Args:
+            calls: List of (method, params) tuples
+            return_errors: If True, failed calls yield a ValueError with the node's
+                message instead of None
+            
+        Returns:
+            List of results in call order (None for calls that returned an error)
+        """
+        results: List[Any] = [None] * len(calls)
+        starts = range(0, len(calls), RPC_BATCH_SIZE)
+        
+        if len(starts) > 1:
+            futures = [
+                self._batch_executor.submit(self._post_batch, calls, start, results, return_errors)
+                for start in starts
+            ]
+            for future in futures:
+                future.result()
+        else:
+            for start in starts:
+                self._post_batch(calls, start, results, return_errors)
+        
+        return results
+    
+    def _post_batch(self, calls: List[tuple], start: int, results: List[Any], return_errors: bool):
+        """
+        POST one JSON-RPC batch (calls[start:start + RPC_BATCH_SIZE]) and store its results.
+        
+        Args:
+            calls: Full list of (method, params) tuples
+            start: Index of the first call in this batch
+            results: Result list to fill in (indexed like calls)
+            return_errors: If True, failed calls yield a ValueError instead of None
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": start + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls[start:start + RPC_BATCH_SIZE])
+        ]
+        
+        response = self._session.post(
+            self.rpc_url,
+            data=orjson.dumps(payload),
+            headers={'Content-Type': 'application/json'},
+            timeout=HTTP_TRANSPORT_OPTIONS['timeout']
+        )
+        response.raise_for_status()
+        items = orjson.loads(response.content)
+        
+        if not isinstance(items, list):
+            raise ValueError(f"Unexpected JSON-RPC batch response: {str(items)[:200]}")
+        
+        for item in items:
+            if 'error' in item:
+                logger.debug(f"Batch call {item.get('id')} failed: {item['error']}")
+                if return_errors:
+                    error = item['error']
+                    results[item['id']] = ValueError(
+                        error.get('message', error) if isinstance(error, dict) else error
+                    )
+                continue
+            results[item['id']] = item.get('result')
+    
+    def get_balances_batch(self, addresses: List[str],
+                           token_addresses: List[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Get native and ERC-20 balances for many addresses with batched RPC calls.
+        
+        Packs one eth_getBalance per address plus one balanceOf eth_call per
+        (address, token) pair into JSON-RPC batch requests, so N lookups cost
+        one HTTP round-trip instead of N. Entries the batch could not resolve
+        fall back to regular per-call lookups. Results also populate the
+        short-lived balance cache.
+        
+        Args:
+            addresses: Wallet addresses
+            token_addresses: Token contract addresses (default: USDC only)
+            
+        Returns:
+            Dict of {address: {'native': balance, token_address: balance, ...}}
+        """
+        if token_addresses is None:
+            token_addresses = [self.usdc_address]
+        
+        # Decimals are looked up once per token, not once per wallet
+        self.warm_decimals(token_addresses)
+        token_decimals = {
+            token_address: self._get_decimals(token_address)
+            for token_address in token_addresses
+        }
+        
+        # Build calls: (address, key, method, params)
+        entries = []
+        for address in addresses:
+            checksum_address = _checksum(address)
+            entries.append((address, 'native', 'eth_getBalance', [checksum_address, 'latest']))
+            call_data = BALANCE_OF_SELECTOR + checksum_address[2:].lower().rjust(64, '0')
+            for token_address in token_addresses:
+                entries.append((address, token_address, 'eth_call', [
+                    {"to": _checksum(token_address), "data": call_data}, 'latest'
+                ]))
+        
+        try:
+            results = self._rpc_batch([(method, params) for _, _, method, params in entries])
+        except Exception as e:
+            logger.warning(f"Batch balance request failed, falling back to per-call lookups: {e}")
+            results = [None] * len(entries)
+        
+        balances: Dict[str, Dict[str, float]] = {address: {} for address in addresses}
+        
+        for (address, key, _, _), result in zip(entries, results):
+            if key == 'native':
+                if result is None:
+                    balances[address][key] = self.get_native_balance(address)
+                else:
+                    balances[address][key] = int(result, 16) / self._scale_18
+                    self._set_cached_balance(_checksum(address), key, balances[address][key])
+            else:
+                if result is None:
+                    balances[address][key] = self.get_token_balance(key, address)
+                else:
+                    balance_raw = int(result, 16) if result not in ('0x', '') else 0
+                    balances[address][key] = balance_raw / (10 ** token_decimals[key])
+                    self._set_cached_balance(_checksum(address), _checksum(key), balances[address][key])
         
-        return 0.0
+        return balances
+    
+    def get_balances_parallel(self, pairs: List[tuple]) -> List[float]:
+        """
+        Get many token balances concurrently on the RPC worker pool.
+        
+        Args:
+            pairs: List of (token_address, wallet_address) tuples
+            
+        Returns:
+            List of balances in the same order as pairs
+        """
+        futures = [
+            self._executor.submit(self.get_token_balance, token_address, wallet_address)
+            for token_address, wallet_address in pairs
+        ]
+        return [future.result() for future in futures]
+    
+    @staticmethod
+    def _balance_of_calldata(address: str) -> bytes:
+        """Build ERC-20 balanceOf(address) calldata."""
+        return bytes.fromhex(BALANCE_OF_SELECTOR[2:] + address[2:].lower().rjust(64, '0'))
+    
+    def _aggregate3(self, calls: List[tuple]) -> List[Optional[bytes]]:
+        """
+        Execute several read-only calls in one eth_call via Multicall3 aggregate3.
+        
+        Each call is sent with allowFailure=True, so one reverting call does not
+        fail the whole batch.
+        
+        Args:
+            calls: List of (target_address, calldata_bytes) tuples
+            
+        Returns:
+            List of return data per call (None for calls that reverted)
+        """
+        payload = [(target, True, call_data) for target, call_data in calls]
+        data = MULTICALL_AGGREGATE3_SELECTOR + encode(['(address,bool,bytes)[]'], [payload]).hex()
+        result = self.w3.eth.call({'to': MULTICALL3_ADDRESS, 'data': data})
+        (results,) = decode(['(bool,bytes)[]'], bytes(result))
+        return [return_data if success else None for success, return_data in results]
+    
+    def _balance_and_decimals(self, token_address: str, wallet_address: str) -> tuple[int, int]:
+        """
+        Fetch balanceOf and decimals for a token in a single Multicall3 eth_call.
+        Falls back to two separate calls if the multicall fails.
+        
+        Args:
+            token_address: Checksum token contract address
+            wallet_address: Checksum wallet address
+            
+        Returns:
+            Tuple of (raw_balance, decimals)
+        """
+        try:
+            balance_data, decimals_data = self._aggregate3([
+                (token_address, self._balance_of_calldata(wallet_address)),
+                (token_address, bytes.fromhex(DECIMALS_SELECTOR[2:]))
+            ])
+        except Exception as e:
+            logger.debug(f"Multicall failed for {token_address}, using separate calls: {e}")
+            balance_data = decimals_data = None
+        
+        if balance_data is None or decimals_data is None:
+            return self._raw_balance_of(token_address, wallet_address), self._get_decimals(token_address)
+        
+        decimals = int.from_bytes(decimals_data, 'big')
+        self._cache_decimals(token_address, decimals)
+        return int.from_bytes(balance_data, 'big'), decimals
+    
+    def get_balances_multicall(self, wallet_address: str,
+                               token_addresses: List[str]) -> Dict[str, float]:
+        """
+        Get several ERC-20 balances for one wallet in a single eth_call via Multicall3.
+        
+        Decimals for tokens not yet cached are fetched in the same call.
+        
+        Args:
+            wallet_address: Wallet address
+            token_addresses: Token contract addresses
+            
+        Returns:
+            Dict of {token_address: balance}
+        """
+        if not token_addresses:
+            return {}
+        
+        checksum_wallet = _checksum(wallet_address)
+        checksum_tokens = [_checksum(token) for token in token_addresses]
+        missing_decimals = list(dict.fromkeys(
+            token for token in checksum_tokens if token not in self._decimals_cache
+        ))
+        
+        balance_data = self._balance_of_calldata(checksum_wallet)
+        decimals_data = bytes.fromhex(DECIMALS_SELECTOR[2:])
+        calls = [(token, balance_data) for token in checksum_tokens]
+        calls += [(token, decimals_data) for token in missing_decimals]
+        
+        try:
+            results = self._aggregate3(calls)
+        except Exception as e:
+            logger.warning(f"Multicall balance lookup failed, falling back to per-token calls: {e}")
+            return {
+                token: self.get_token_balance(token, checksum_wallet)
+                for token in token_addresses
+            }
+        
+        for token, raw in zip(missing_decimals, results[len(checksum_tokens):]):
+            if raw:
+                self._cache_decimals(token, int.from_bytes(raw, 'big'))
+        
+        balances = {}
+        for token, checksum_token, raw in zip(token_addresses, checksum_tokens, results):
+            if raw is None:
+                # Call reverted inside the multicall; retry it on its own
+                balances[token] = self.get_token_balance(token, checksum_wallet)
+                continue
+            
+            balance_raw = int.from_bytes(raw, 'big') if raw else 0
+            balance = balance_raw / (10 ** self._get_decimals(checksum_token))
+            self._set_cached_balance(checksum_wallet, checksum_token, balance)
+            balances[token] = balance
+        
+        return balances
+    
+    def _cache_decimals(self, token_address: str, decimals: int):
+        """
+        Store token decimals in the cache.
+        
+        Args:
+            token_address: Checksum token contract address
+            decimals: Number of decimals
+        """
+        with self._token_cache_lock:
+            self._decimals_cache.setdefault(token_address, decimals)
+    
+    def _call_decimals(self, token_address: str) -> int:
+        """
+        Read a token's decimals() from chain without building a Contract.
+        
+        Args:
+            token_address: Checksum token contract address
+            
+        Returns:
+            Number of decimals
+        """
+        return int(self._rpc('eth_call', [{'to': token_address, 'data': DECIMALS_SELECTOR}, 'latest']), 16)
+    
+    def _get_decimals(self, token_address: str) -> int:
+        """
+        Get token decimals, fetching from chain only on first use.
+        
+        Args:
+            token_address: Token contract address
+            
+        Returns:
+            Number of decimals
+        """
+        checksum_address = _checksum(token_address)
+        decimals = self._decimals_cache.get(checksum_address)
+        if decimals is None:
+            decimals = self._call_decimals(checksum_address)
+            self._cache_decimals(checksum_address, decimals)
+        return decimals
+    
+    def warm_decimals(self, token_addresses: List[str]):
+        """
+        Preload decimals for several tokens with a single JSON-RPC batch.
+        
+        Args:
+            token_addresses: Token contract addresses
+        """
+        missing = []
+        for token_address in token_addresses:
+            checksum_address = _checksum(token_address)
+            if checksum_address not in self._decimals_cache and checksum_address not in missing:
+                missing.append(checksum_address)
+        
+        if not missing:
+            return
+        
+        try:
+            results = self._rpc_batch([
+                ('eth_call', [{"to": token_address, "data": DECIMALS_SELECTOR}, 'latest'])
+                for token_address in missing
+            ])
+        except Exception as e:
+            logger.warning(f"Failed to preload token decimals: {e}")
+            return
+        
+        for token_address, result in zip(missing, results):
+            if result and result != '0x':
+                self._cache_decimals(token_address, int(result, 16))
+    
+    @functools.cached_property
+    def usdc_contract(self) -> Contract:
+        """USDC contract instance, built on first access."""
+        return self.get_token_contract(self.usdc_address)
     
     def get_token_contract(self, token_address: str) -> Contract:
         """
@@ -263,8 +1168,57 @@ class BlockchainClient:
         Returns:
             Contract instance
         """
-        checksum_address = Web3.to_checksum_address(token_address)
-        return self.w3.eth.contract(address=checksum_address, abi=ERC20_ABI)
+        contract = self._contract_cache.get(token_address)
+        if contract is None:
+            checksum_address = _checksum(token_address)
+            with self._token_cache_lock:
+                contract = self._contract_cache.get(checksum_address)
+                if contract is None:
+                    contract = self.w3.eth.contract(address=checksum_address, abi=ERC20_ABI)
+                    self._contract_cache[checksum_address] = contract
+                self._contract_cache[token_address] = contract
+        return contract
+    
+    @staticmethod
+    def _to_base_units(amount: Amount, scale: int) -> int:
+        """
+        Convert a token amount to integer base units (e.g. USDC to 10^-6 units).
+        
+        Decimal and int amounts are converted exactly. Floats go through their
+        shortest string form so 0.1 becomes exactly 0.1 rather than its binary
+        approximation.
+        
+        Args:
+            amount: Amount in whole tokens
+            scale: 10 ** token decimals
+            
+        Returns:
+            Amount in base units (truncated toward zero)
+        """
+        if isinstance(amount, float):
+            amount = str(amount)
+        return int(Decimal(amount) * scale)
+    
+    @staticmethod
+    def _transfer_calldata(to_address: str, amount: int, suffix: bytes = b'') -> str:
+        """
+        Build ERC-20 transfer(address,uint256) calldata directly from bytes.
+        
+        Args:
+            to_address: Recipient address
+            amount: Amount in smallest token units
+            suffix: Extra bytes appended after the ABI arguments (e.g. order memo)
+            
+        Returns:
+            Hex-encoded calldata
+        """
+        data = (
+            TRANSFER_SELECTOR
+            + bytes.fromhex(to_address[2:]).rjust(32, b'\x00')
+            + amount.to_bytes(32, 'big')
+            + suffix
+        )
+        return '0x' + data.hex()
     
     def get_token_balance(self, token_address: str, wallet_address: str, max_retries: int = 3) -> float:
         """
@@ -278,35 +1232,37 @@ class BlockchainClient:
         Returns:
             Token balance
         """
-        for attempt in range(1, max_retries + 1):
-            try:
-                contract = self.get_token_contract(token_address)
-                checksum_wallet = Web3.to_checksum_address(wallet_address)
-                
-                balance_raw = contract.functions.balanceOf(checksum_wallet).call()
-                decimals = contract.functions.decimals().call()
-                balance = balance_raw / (10 ** decimals)
-                
-                return float(balance)
-            except Exception as e:
-                error_msg = str(e).lower()
-                is_network_error = any(keyword in error_msg for keyword in [
-                    'connection', 'timeout', 'reset', 'refused', 'unreachable'
-                ])
-                
-                if is_network_error and attempt < max_retries:
-                    logger.warning(f"[Attempt {attempt}/{max_retries}] Network error getting token balance for {wallet_address}, retrying...")
-                    time.sleep(1)
-                    continue
-                
-                logger.error(f"Failed to get token balance for {wallet_address}: {e}")
-                return 0.0
+        checksum_token = _checksum(token_address)
+        checksum_wallet = _checksum(wallet_address)
         
-        return 0.0
+        cached = self._get_cached_balance(checksum_wallet, checksum_token)
+        if cached is not None:
+            return cached
+        
+        def fetch():
+            decimals = self._decimals_cache.get(checksum_token)
+            if decimals is None:
+                # First lookup for this token: balanceOf and decimals in one multicall
+                return self._balance_and_decimals(checksum_token, checksum_wallet)
+            return self._raw_balance_of(checksum_token, checksum_wallet), decimals
+        
+        try:
+            balance_raw, decimals = self._retry_rpc(
+                fetch,
+                max_retries=max_retries,
+                description=f"Getting token balance for {wallet_address}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to get token balance for {wallet_address}: {e}")
+            return 0.0
+        
+        balance = balance_raw / (10 ** decimals)
+        self._set_cached_balance(checksum_wallet, checksum_token, balance)
+        return balance
     
     def submit_buy_order(self, from_private_key: str, stock_ticker: str,
-                        stock_token_address: str, usdc_amount: float,
-                        stock_quantity: float, customer_id: str,
+                        stock_token_address: str, usdc_amount: Amount,
+                        stock_quantity: Amount, customer_id: str,
                         mint_address: str, expiry_days: int,
                         order_type: str = 'LIMIT',
                         dry_run: bool = False) -> Optional[str]:
@@ -328,14 +1284,15 @@ class BlockchainClient:
         Returns:
             Transaction hash or None on failure
         """
+        from_address = None
         try:
             sender_account = self.get_account(from_private_key)
             from_address = sender_account.address
             
             # USDC uses self.usdc_decimals (usually 6 or 18 depending on chain)
             # Stock tokens always use 18 decimals
-            offer_wei = int(usdc_amount * (10 ** self.usdc_decimals))
-            request_wei = int(stock_quantity * (10 ** 18))
+            offer_wei = self._to_base_units(usdc_amount, self._usdc_scale)
+            request_wei = self._to_base_units(stock_quantity, self._stock_scale)
             
             # Build memo
             memo = {
@@ -343,114 +1300,39 @@ class BlockchainClient:
                 "type": order_type,  # 'LIMIT' or 'MARKET'
                 "offer": offer_wei,
                 "request": request_wei,
-                "token_address": Web3.to_checksum_address(stock_token_address),
+                "token_address": _checksum(stock_token_address),
                 "expiry_days": expiry_days,
                 "did_id": from_address
             }
             
+            # Encode memo once; reused for logging and calldata
+            memo_bytes = _encode_memo(memo)
+            
             logger.info(f"Buy order: {usdc_amount} USDC for {stock_quantity} {stock_ticker} (type: {order_type})")
-            logger.info(f"Memo: {json.dumps(memo)}")
+            logger.info("Memo: %s", memo_bytes.decode())
             
             if dry_run:
                 logger.info("[DRY RUN] Would submit buy order")
                 return f"0xdry_buy_{customer_id}"
             
-            # Check USDC balance
-            usdc_balance = self.get_usdc_balance(from_address)
-            if usdc_balance < usdc_amount:
-                logger.error(f"Insufficient USDC: {usdc_balance} < {usdc_amount}")
-                return None
-            
-            # Encode memo as JSON string, then to hex
-            memo_json = json.dumps(memo, separators=(',', ':'))
-            memo_bytes = memo_json.encode('utf-8')
-            
-            # Build USDC transfer with memo appended to data
-            to_checksum = Web3.to_checksum_address(mint_address)
-            # Get nonce (includes pending transactions)
-            nonce = self.get_nonce(from_address)
-            
-            # Standard ERC20 transfer data
-            transfer_data = self.usdc_contract.functions.transfer(
-                to_checksum, offer_wei
-            ).build_transaction({
-                'from': from_address,
-                'nonce': nonce,
-                'chainId': self.chain_id
-            })['data']
-            
-            # Append memo to transaction data
-            if isinstance(transfer_data, bytes):
-                transfer_data_hex = transfer_data.hex()
-            else:
-                transfer_data_hex = transfer_data[2:] if transfer_data.startswith('0x') else transfer_data
-            
-            transaction_data = '0x' + transfer_data_hex + memo_bytes.hex()
-            
-            # Estimate gas
-            transaction = {
-                'from': from_address,
-                'to': self.usdc_address,
-                'data': transaction_data,
-                'nonce': nonce,
-                'chainId': self.chain_id
-            }
-            
-            try:
-                gas_estimate = self.w3.eth.estimate_gas(transaction)
-                gas_limit = int(gas_estimate * 1.3)  # 30% buffer
-            except:
-                gas_limit = 150000  # Safe fallback
-            
-            transaction['gas'] = gas_limit
-            
-            # Add EIP-1559 gas parameters
-            transaction = self.build_eip1559_transaction(transaction)
-            
-            # Sign and send
-            # Use Account directly (web3.py 6.0+ compatible)
-            signed_txn = Account.sign_transaction(transaction, from_private_key)
-            # Support both old (rawTransaction) and new (raw_transaction) web3.py versions
-            raw_tx = getattr(signed_txn, 'raw_transaction', None) or getattr(signed_txn, 'rawTransaction', None)
-            tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-            tx_hash_hex = tx_hash.hex()
-            
-            logger.info(f"Buy order submitted: {tx_hash_hex}")
-            
-            # Wait for confirmation
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
-            
-            if receipt['status'] == 1:
-                logger.info(f"Buy order confirmed: {tx_hash_hex}")
-                return tx_hash_hex
-            else:
-                logger.error(f"Buy order failed: {tx_hash_hex}")
-                return None
+            # No balance pre-check: an underfunded transfer reverts during gas estimation
+            return self._submit_transfer_with_memo(
+                sender_account, self.usdc_address, mint_address,
+                offer_wei, memo_bytes, label="Buy"
+            )
                 
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Buy order error: {e}", exc_info=True)
-            
-            # Special handling for nonce errors
-            if 'nonce' in error_msg.lower():
-                try:
-                    # Reset nonce cache for this address
-                    self.reset_nonce_cache(from_address)
-                    
-                    # Get fresh nonce from blockchain for debugging
-                    with self._nonce_lock:
-                        current_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address))
-                        pending_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address), 'pending')
-                    logger.error(f"Nonce debug - Address: {from_address}, Current: {current_nonce}, Pending: {pending_nonce}")
-                    logger.info(f"Nonce cache reset for {from_address}, will resync on next transaction")
-                except:
-                    pass
+            if from_address and self._is_balance_error(e):
+                logger.error(f"Insufficient USDC: {from_address} cannot cover {usdc_amount} USDC ({e})")
+                self.nonces.release_and_resync(from_address)
+                return None
             
+            self._log_order_error("Buy", e, from_address)
             return None
     
     def submit_sell_order(self, from_private_key: str, stock_ticker: str,
-                         stock_token_address: str, stock_quantity: float,
-                         usdc_amount: float, customer_id: str,
+                         stock_token_address: str, stock_quantity: Amount,
+                         usdc_amount: Amount, customer_id: str,
                          burn_address: str, expiry_days: int,
                          order_type: str = 'LIMIT',
                          dry_run: bool = False) -> Optional[str]:
@@ -472,6 +1354,7 @@ class BlockchainClient:
         Returns:
             Transaction hash or None on failure
         """
+        from_address = None
         try:
             sender_account = self.get_account(from_private_key)
             from_address = sender_account.address
@@ -479,8 +1362,9 @@ class BlockchainClient:
             # Stock tokens use 18 decimals, truncate last 6 digits to avoid
             # rounding dust that could exceed the wallet's actual balance
             # USDC uses self.usdc_decimals
-            offer_wei = int(stock_quantity * (10 ** 18)) // (10 ** 6) * (10 ** 6)
-            request_wei = int(usdc_amount * (10 ** self.usdc_decimals))
+            quantity_wei = self._to_base_units(stock_quantity, self._stock_scale)
+            offer_wei = quantity_wei // self._dust_scale * self._dust_scale
+            request_wei = self._to_base_units(usdc_amount, self._usdc_scale)
             
             # Build memo
             memo = {
@@ -488,13 +1372,16 @@ class BlockchainClient:
                 "type": order_type,  # 'LIMIT' or 'MARKET'
                 "offer": offer_wei,
                 "request": request_wei,
-                "token_address": Web3.to_checksum_address(stock_token_address),
+                "token_address": _checksum(stock_token_address),
                 "expiry_days": expiry_days,
                 "did_id": from_address
             }
             
+            # Encode memo once; reused for logging and calldata
+            memo_bytes = _encode_memo(memo)
+            
             logger.info(f"Sell order: {stock_quantity} {stock_ticker} for {usdc_amount} USDC (type: {order_type})")
-            logger.info(f"Memo: {json.dumps(memo)}")
+            logger.info("Memo: %s", memo_bytes.decode())
             
             if dry_run:
                 logger.info("[DRY RUN] Would submit sell order")
@@ -508,116 +1395,118 @@ class BlockchainClient:
                 return None
             
             if stock_balance < stock_quantity:
-                difference_pct = ((stock_quantity - stock_balance) / stock_quantity) * 100
+                difference_pct = ((float(stock_quantity) - stock_balance) / float(stock_quantity)) * 100
                 logger.warning(
                     f"Stock balance less than requested: {stock_balance} < {stock_quantity} "
                     f"(diff: {difference_pct:.2f}%), selling entire balance instead"
                 )
                 
-                original_quantity = stock_quantity
                 stock_quantity = stock_balance
-                offer_wei = int(stock_quantity * (10 ** 18))
+                offer_wei = self._to_base_units(stock_quantity, self._stock_scale)
                 
-                adjusted_usdc_amount = (usdc_amount / original_quantity) * stock_quantity
-                request_wei = int(adjusted_usdc_amount * (10 ** self.usdc_decimals))
+                # Scale the requested USDC by the same ratio as the quantity (integer math)
+                request_wei = request_wei * offer_wei // quantity_wei
+                adjusted_usdc_amount = request_wei / self._usdc_scale
                 
                 memo["offer"] = offer_wei
                 memo["request"] = request_wei
+                memo_bytes = _encode_memo(memo)
                 
                 logger.info(f"Adjusted sell order: {stock_quantity:.10f} {stock_ticker} for ${adjusted_usdc_amount:.2f} USDC")
             
-            # Get stock token contract
-            stock_contract = self.get_token_contract(stock_token_address)
-            
-            # Encode memo
-            memo_json = json.dumps(memo, separators=(',', ':'))
-            memo_bytes = memo_json.encode('utf-8')
-            
-            # Build stock token transfer with memo
-            to_checksum = Web3.to_checksum_address(burn_address)
-            # Get nonce (includes pending transactions)
-            nonce = self.get_nonce(from_address)
-            
-            # Standard ERC20 transfer data
-            transfer_data = stock_contract.functions.transfer(
-                to_checksum, offer_wei
-            ).build_transaction({
-                'from': from_address,
-                'nonce': nonce,
-                'chainId': self.chain_id
-            })['data']
-            
-            # Append memo to transaction data
-            if isinstance(transfer_data, bytes):
-                transfer_data_hex = transfer_data.hex()
-            else:
-                transfer_data_hex = transfer_data[2:] if transfer_data.startswith('0x') else transfer_data
-            
-            transaction_data = '0x' + transfer_data_hex + memo_bytes.hex()
-            
-            # Estimate gas
-            transaction = {
-                'from': from_address,
-                'to': Web3.to_checksum_address(stock_token_address),
-                'data': transaction_data,
-                'nonce': nonce,
-                'chainId': self.chain_id
-            }
-            
-            try:
-                gas_estimate = self.w3.eth.estimate_gas(transaction)
-                gas_limit = int(gas_estimate * 1.3)  # 30% buffer
-            except:
-                gas_limit = 150000  # Safe fallback
-            
-            transaction['gas'] = gas_limit
-            
-            # Add EIP-1559 gas parameters
-            transaction = self.build_eip1559_transaction(transaction)
-            
-            # Sign and send
-            # Use Account directly (web3.py 6.0+ compatible)
-            signed_txn = Account.sign_transaction(transaction, from_private_key)
-            # Support both old (rawTransaction) and new (raw_transaction) web3.py versions
-            raw_tx = getattr(signed_txn, 'raw_transaction', None) or getattr(signed_txn, 'rawTransaction', None)
-            tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-            tx_hash_hex = tx_hash.hex()
-            
-            logger.info(f"Sell order submitted: {tx_hash_hex}")
-            
-            # Wait for confirmation
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
-            
-            if receipt['status'] == 1:
-                logger.info(f"Sell order confirmed: {tx_hash_hex}")
-                return tx_hash_hex
-            else:
-                logger.error(f"Sell order failed: {tx_hash_hex}")
-                return None
+            return self._submit_transfer_with_memo(
+                sender_account, _checksum(stock_token_address), burn_address,
+                offer_wei, memo_bytes, label="Sell"
+            )
                 
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Sell order error: {e}", exc_info=True)
-            
-            # Special handling for nonce errors
-            if 'nonce' in error_msg.lower():
-                try:
-                    # Reset nonce cache for this address
-                    self.reset_nonce_cache(from_address)
-                    
-                    # Get fresh nonce from blockchain for debugging
-                    with self._nonce_lock:
-                        current_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address))
-                        pending_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address), 'pending')
-                    logger.error(f"Nonce debug - Address: {from_address}, Current: {current_nonce}, Pending: {pending_nonce}")
-                    logger.info(f"Nonce cache reset for {from_address}, will resync on next transaction")
-                except:
-                    pass
-            
+            self._log_order_error("Sell", e, from_address)
             return None
     
+    def _submit_transfer_with_memo(self, sender_account: LocalAccount, token_address: str,
+                                   to_address: str, amount_wei: int, memo_bytes: bytes,
+                                   label: str) -> Optional[str]:
+        """
+        Send an ERC20 transfer with a memo appended to the calldata and wait for it.
+        
+        Shared by submit_buy_order and submit_sell_order.
+        
+        Args:
+            sender_account: Sender's account
+            token_address: Checksum address of the token being transferred
+            to_address: Pool mint/burn address
+            amount_wei: Amount to transfer in token base units
+            memo_bytes: Encoded order memo
+            label: Order side used in log messages ('Buy' or 'Sell')
+            
+        Returns:
+            Transaction hash, or None if the transaction reverted
+        """
+        from_address = sender_account.address
+        
+        # Standard ERC20 transfer data with memo appended
+        transaction = {
+            **self._tx_defaults,
+            'from': from_address,
+            'to': token_address,
+            'data': self._transfer_calldata(_checksum(to_address), amount_wei, memo_bytes)
+        }
+        
+        # Nonce (includes pending transactions), fees and gas estimate fetched concurrently
+        # 30% gas buffer, 150000 as safe fallback if estimation fails
+        nonce, fee_params, gas_limit = self._preflight(
+            from_address, transaction, gas_buffer=1.3, gas_fallback=150000
+        )
+        
+        transaction['nonce'] = nonce
+        transaction['gas'] = gas_limit
+        
+        # Add EIP-1559 gas parameters (fetched during preflight)
+        transaction.update(fee_params)
+        
+        # Sign and send
+        # Sign with the cached account (key already derived)
+        signed_txn = sender_account.sign_transaction(transaction)
+        raw_tx = getattr(signed_txn, _RAW_TX_ATTR)
+        tx_hash_hex = self._send_raw_transaction(raw_tx)
+        
+        logger.info(f"{label} order submitted: {tx_hash_hex}")
+        
+        # Wait for confirmation
+        receipt = self._wait_receipt(tx_hash_hex, timeout=300)
+        self.invalidate_balance(from_address)
+        
+        if receipt['status'] == 1:
+            logger.info(f"{label} order confirmed: {tx_hash_hex}")
+            return tx_hash_hex
+        
+        logger.error(f"{label} order failed: {tx_hash_hex}")
+        return None
+    
+    def _log_order_error(self, label: str, error: Exception, from_address: Optional[str]):
+        """
+        Log a failed order submission and resync the sender's nonce.
+        
+        Args:
+            label: Order side used in log messages ('Buy' or 'Sell')
+            error: Exception raised during submission
+            from_address: Sender address, or None if the account couldn't be loaded
+        """
+        logger.error(f"{label} order error: {error}", exc_info=True)
+        
+        if not from_address:
+            return
+        
+        # A reserved nonce may have gone unused; resync with chain
+        pending_nonce = self.nonces.release_and_resync(from_address)
+        
+        # Special handling for nonce errors
+        if self._is_nonce_error(error):
+            logger.error(f"Nonce debug - Address: {from_address}, Pending: {pending_nonce}")
+            logger.info(f"Nonce cache reset for {from_address}, will resync on next transaction")
+    
     def transfer_usdc(self, from_private_key: str, to_address: str, 
-                     amount: float, dry_run: bool = False, max_retries: int = 3) -> Optional[str]:
+                     amount: Amount, dry_run: bool = False, max_retries: int = 3) -> Optional[str]:
         """
         Transfer USDC from one address to another with automatic retry on nonce errors.
         
@@ -636,10 +1525,10 @@ class BlockchainClient:
         from_address = sender_account.address
         
         # Convert addresses to checksum format
-        to_checksum = Web3.to_checksum_address(to_address)
+        to_checksum = _checksum(to_address)
         
         # Convert amount to wei
-        amount_raw = int(amount * (10 ** self.usdc_decimals))
+        amount_raw = self._to_base_units(amount, self._usdc_scale)
         
         logger.info(f"Transferring {amount} USDC from {from_address} to {to_address}")
         
@@ -656,42 +1545,37 @@ class BlockchainClient:
         # Retry loop for nonce errors
         for attempt in range(1, max_retries + 1):
             try:
-                # Build transaction
-                # Get nonce (includes pending transactions)
-                nonce = self.get_nonce(from_address)
-                
-                # Estimate gas
-                gas_estimate = self.usdc_contract.functions.transfer(
-                    to_checksum, amount_raw
-                ).estimate_gas({'from': from_address})
-                
-                # Build base transaction
-                transaction = self.usdc_contract.functions.transfer(
-                    to_checksum, amount_raw
-                ).build_transaction({
+                # Build base transaction (calldata encoded locally)
+                transaction = {
+                    **self._tx_defaults,
                     'from': from_address,
-                    'gas': int(gas_estimate * 1.2),  # Add 20% buffer
-                    'nonce': nonce,
-                    'chainId': self.chain_id
-                })
+                    'to': self.usdc_address,
+                    'data': self._transfer_calldata(to_checksum, amount_raw)
+                }
+                
+                # Nonce (includes pending transactions), fees and gas estimate
+                # fetched concurrently; 20% gas buffer
+                nonce, fee_params, gas_limit = self._preflight(from_address, transaction, gas_buffer=1.2)
+                transaction['nonce'] = nonce
+                transaction['gas'] = gas_limit
                 
-                # Add EIP-1559 gas parameters
-                transaction = self.build_eip1559_transaction(transaction)
+                # Add EIP-1559 gas parameters (fetched during preflight)
+                transaction.update(fee_params)
                 
                 # Sign transaction
-                # Use Account directly (web3.py 6.0+ compatible)
-                signed_txn = Account.sign_transaction(transaction, from_private_key)
+                # Sign with the cached account (key already derived)
+                signed_txn = sender_account.sign_transaction(transaction)
                 
                 # Send transaction
-                # Support both old (rawTransaction) and new (raw_transaction) web3.py versions
-                raw_tx = getattr(signed_txn, 'raw_transaction', None) or getattr(signed_txn, 'rawTransaction', None)
-                tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-                tx_hash_hex = tx_hash.hex()
+                raw_tx = getattr(signed_txn, _RAW_TX_ATTR)
+                tx_hash_hex = self._send_raw_transaction(raw_tx)
                 
                 logger.info(f"USDC transfer submitted: {tx_hash_hex}")
                 
                 # Wait for confirmation
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+                receipt = self._wait_receipt(tx_hash_hex, timeout=300)
+                self.invalidate_balance(from_address)
+                self.invalidate_balance(to_checksum)
                 
                 if receipt['status'] == 1:
                     logger.info(f"USDC transfer confirmed: {tx_hash_hex}")
@@ -701,44 +1585,66 @@ class BlockchainClient:
                     return None
                     
             except Exception as e:
-                error_msg = str(e)
-                is_nonce_error = self._is_nonce_error(e)
+                nonce_error = self._classify_nonce_error(e)
+                is_nonce_error = nonce_error != 'other'
                 
-                if is_nonce_error and attempt < max_retries:
-                    # Reset nonce cache and retry
-                    self.reset_nonce_cache(from_address)
-                    
-                    # Get fresh nonce from blockchain for debugging
-                    try:
-                        with self._nonce_lock:
-                            current_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address))
-                            pending_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address), 'pending')
-                        logger.warning(f"[Attempt {attempt}/{max_retries}] Nonce error - Address: {from_address}, Current: {current_nonce}, Pending: {pending_nonce}")
-                        logger.info(f"Nonce cache reset, retrying in 2 seconds...")
-                        time.sleep(2)  # Brief delay before retry
-                        continue
-                    except:
-                        pass
+                # Only stale-nonce errors are worth another attempt
+                if nonce_error == 'retry' and attempt < max_retries:
+                    # Resync nonce from chain and retry
+                    pending_nonce = self.nonces.release_and_resync(from_address)
+                    logger.warning(f"[Attempt {attempt}/{max_retries}] Nonce error - Address: {from_address}, Pending: {pending_nonce}")
+                    delay = self._retry_delay(attempt)
+                    logger.info(f"Nonce cache reset, retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
+                    continue
+                
+                # A reserved nonce may have gone unused; resync with chain
+                pending_nonce = self.nonces.release_and_resync(from_address)
                 
                 # Log error and exit
                 logger.error(f"USDC transfer error: {e}")
                 if is_nonce_error:
-                    try:
-                        self.reset_nonce_cache(from_address)
-                        with self._nonce_lock:
-                            current_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address))
-                            pending_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address), 'pending')
-                        logger.error(f"Nonce debug - Address: {from_address}, Current: {current_nonce}, Pending: {pending_nonce}")
-                    except:
-                        pass
+                    logger.error(f"Nonce debug - Address: {from_address}, Pending: {pending_nonce}")
                 
                 return None
         
         logger.error(f"USDC transfer failed after {max_retries} attempts")
         return None
     
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter before the next transfer attempt.
+        
+        Args:
+            attempt: Attempt number that just failed (1-based)
+            
+        Returns:
+            Seconds to wait
+        """
+        return min(self._retry_max_delay, self._retry_base_delay * (2 ** (attempt - 1))) + random.uniform(0, 0.2)
+    
+    def _is_contract(self, address: str) -> bool:
+        """
+        Check whether an address has contract code (cached per address).
+        
+        Args:
+            address: Checksum address
+            
+        Returns:
+            True if the address is a contract, or if the lookup failed
+        """
+        is_contract = self._code_cache.get(address)
+        if is_contract is None:
+            try:
+                is_contract = self._rpc('eth_getCode', [address, 'latest']) not in ('0x', '')
+            except Exception as e:
+                logger.debug(f"Code lookup failed for {address}, assuming contract: {e}")
+                return True
+            self._code_cache[address] = is_contract
+        return is_contract
+    
     def transfer_native_token(self, from_private_key: str, to_address: str,
-                             amount: float, dry_run: bool = False, max_retries: int = 3) -> Optional[str]:
+                             amount: Amount, dry_run: bool = False, max_retries: int = 3) -> Optional[str]:
         """
         Transfer native token (ETH/BNB) from one address to another with automatic retry on nonce errors.
         
@@ -757,10 +1663,10 @@ class BlockchainClient:
         from_address = sender_account.address
         
         # Convert addresses to checksum format
-        to_checksum = Web3.to_checksum_address(to_address)
+        to_checksum = _checksum(to_address)
         
         # Convert amount to wei (18 decimals for all native tokens)
-        amount_wei = int(amount * (10 ** 18))
+        amount_wei = self._to_base_units(amount, self._scale_18)
         
         native_token = self.chain_config.get('native_token', 'ETH')
         logger.info(f"Transferring {amount} {native_token} from {from_address} to {to_address}")
@@ -771,7 +1677,7 @@ class BlockchainClient:
         
         # Check balance (outside retry loop)
         sender_balance_wei = self.w3.eth.get_balance(from_address)
-        sender_balance = sender_balance_wei / (10 ** 18)
+        sender_balance = sender_balance_wei / self._scale_18
         
         # Need to reserve some for gas (use config if available, otherwise fallback)
         if self.config:
@@ -780,51 +1686,50 @@ class BlockchainClient:
             # Fallback to chain config or default
             gas_reserve = self.chain_config.get('gas_cost_estimate', 0.0002)
         
-        if sender_balance < (amount + gas_reserve):
-            logger.error(f"Insufficient {native_token} balance: {sender_balance} < {amount + gas_reserve} (including gas reserve)")
+        if sender_balance < (float(amount) + gas_reserve):
+            logger.error(f"Insufficient {native_token} balance: {sender_balance} < {float(amount) + gas_reserve} (including gas reserve)")
             return None
         
+        # A plain transfer to an EOA always costs 21000 gas; only estimate for contracts
+        estimate_gas = self._is_contract(to_checksum)
+        
         # Retry loop for nonce errors
         for attempt in range(1, max_retries + 1):
             try:
-                # Build transaction
-                # Get nonce (includes pending transactions)
-                nonce = self.get_nonce(from_address)
-                
                 # Build base transaction
                 transaction = {
+                    **self._tx_defaults,
                     'from': from_address,
                     'to': to_checksum,
-                    'value': amount_wei,
-                    'nonce': nonce,
-                    'chainId': self.chain_id
+                    'value': amount_wei
                 }
                 
-                # Estimate gas for simple transfer
-                try:
-                    gas_estimate = self.w3.eth.estimate_gas(transaction)
-                    gas_limit = int(gas_estimate * 1.2)  # Add 20% buffer
-                except Exception as e:
-                    logger.warning(f"Failed to estimate gas for native transfer: {e}")
-                    gas_limit = 21000  # Standard ETH transfer gas
+                # Nonce (includes pending transactions), fees and gas estimate fetched
+                # concurrently; 20% gas buffer, standard 21000 transfer gas as fallback
+                nonce, fee_params, gas_limit = self._preflight(
+                    from_address, transaction if estimate_gas else None,
+                    gas_buffer=1.2, gas_fallback=21000
+                )
                 
-                transaction['gas'] = gas_limit
+                transaction['nonce'] = nonce
+                transaction['gas'] = gas_limit or 21000
                 
-                # Add EIP-1559 gas parameters
-                transaction = self.build_eip1559_transaction(transaction)
+                # Add EIP-1559 gas parameters (fetched during preflight)
+                transaction.update(fee_params)
                 
                 # Sign transaction
-                signed_txn = Account.sign_transaction(transaction, from_private_key)
+                signed_txn = sender_account.sign_transaction(transaction)
                 
                 # Send transaction
-                raw_tx = getattr(signed_txn, 'raw_transaction', None) or getattr(signed_txn, 'rawTransaction', None)
-                tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-                tx_hash_hex = tx_hash.hex()
+                raw_tx = getattr(signed_txn, _RAW_TX_ATTR)
+                tx_hash_hex = self._send_raw_transaction(raw_tx)
                 
                 logger.info(f"{native_token} transfer submitted: {tx_hash_hex}")
                 
                 # Wait for confirmation
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+                receipt = self._wait_receipt(tx_hash_hex, timeout=300)
+                self.invalidate_balance(from_address)
+                self.invalidate_balance(to_checksum)
                 
                 if receipt['status'] == 1:
                     logger.info(f"{native_token} transfer confirmed: {tx_hash_hex}")
@@ -834,42 +1739,121 @@ class BlockchainClient:
                     return None
                     
             except Exception as e:
-                error_msg = str(e)
-                is_nonce_error = self._is_nonce_error(e)
+                nonce_error = self._classify_nonce_error(e)
+                is_nonce_error = nonce_error != 'other'
                 
-                if is_nonce_error and attempt < max_retries:
-                    # Reset nonce cache and retry
-                    self.reset_nonce_cache(from_address)
-                    
-                    # Get fresh nonce from blockchain for debugging
-                    try:
-                        with self._nonce_lock:
-                            current_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address))
-                            pending_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address), 'pending')
-                        logger.warning(f"[Attempt {attempt}/{max_retries}] Nonce error - Address: {from_address}, Current: {current_nonce}, Pending: {pending_nonce}")
-                        logger.info(f"Nonce cache reset, retrying in 2 seconds...")
-                        time.sleep(2)  # Brief delay before retry
-                        continue
-                    except:
-                        pass
+                # Only stale-nonce errors are worth another attempt
+                if nonce_error == 'retry' and attempt < max_retries:
+                    # Resync nonce from chain and retry
+                    pending_nonce = self.nonces.release_and_resync(from_address)
+                    logger.warning(f"[Attempt {attempt}/{max_retries}] Nonce error - Address: {from_address}, Pending: {pending_nonce}")
+                    delay = self._retry_delay(attempt)
+                    logger.info(f"Nonce cache reset, retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
+                    continue
+                
+                # A reserved nonce may have gone unused; resync with chain
+                pending_nonce = self.nonces.release_and_resync(from_address)
                 
                 # Log error and exit
                 logger.error(f"Native token transfer error: {e}")
                 if is_nonce_error:
-                    try:
-                        self.reset_nonce_cache(from_address)
-                        with self._nonce_lock:
-                            current_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address))
-                            pending_nonce = self.w3.eth.get_transaction_count(Web3.to_checksum_address(from_address), 'pending')
-                        logger.error(f"Nonce debug - Address: {from_address}, Current: {current_nonce}, Pending: {pending_nonce}")
-                    except:
-                        pass
+                    logger.error(f"Nonce debug - Address: {from_address}, Pending: {pending_nonce}")
                 
                 return None
         
         logger.error(f"{native_token} transfer failed after {max_retries} attempts")
         return None
     
+    def _wait_receipt(self, tx_hash: str, timeout: float = 300):
+        """
+        Wait for a transaction receipt.
+        
+        With a WebSocket connection, a block filter is installed and the receipt
+        is checked once per new head. Otherwise (or if the node refuses filters)
+        the receipt is polled every RECEIPT_POLL_INITIAL seconds at first, with
+        the delay doubling up to the chain's receipt_poll_interval.
+        
+        Args:
+            tx_hash: Transaction hash
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Transaction receipt
+            
+        Raises:
+            TimeExhausted: If no receipt is available before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        
+        if self.ws_w3 is not None:
+            receipt = self._wait_receipt_on_heads(tx_hash, deadline)
+            if receipt is not None:
+                return receipt
+        
+        delay = min(RECEIPT_POLL_INITIAL, self._receipt_poll_max)
+        
+        while True:
+            try:
+                return self._receipt_w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeExhausted(f"Transaction {tx_hash} not mined after {timeout} seconds")
+            
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self._receipt_poll_max)
+    
+    def _wait_receipt_on_heads(self, tx_hash: str, deadline: float):
+        """
+        Wait for a receipt by checking it once per new block head over WebSocket.
+        
+        Args:
+            tx_hash: Transaction hash
+            deadline: time.monotonic() value after which to give up
+            
+        Returns:
+            Transaction receipt, or None if the head filter is unavailable or
+            the deadline passed (the caller falls back to polling)
+        """
+        make_request = self.ws_w3.provider.make_request
+        
+        try:
+            response = make_request('eth_newBlockFilter', [])
+            if 'error' in response:
+                raise ValueError(response['error'])
+            filter_id = response['result']
+        except Exception as e:
+            logger.debug(f"Block filter unavailable, polling for receipt: {e}")
+            return None
+        
+        try:
+            check = True
+            while time.monotonic() < deadline:
+                if check:
+                    try:
+                        return self.ws_w3.eth.get_transaction_receipt(tx_hash)
+                    except TransactionNotFound:
+                        pass
+                
+                time.sleep(RECEIPT_HEAD_POLL)
+                response = make_request('eth_getFilterChanges', [filter_id])
+                if 'error' in response:
+                    logger.debug(f"Block filter dropped, polling for receipt: {response['error']}")
+                    return None
+                check = bool(response.get('result'))
+            return None
+        except Exception as e:
+            logger.debug(f"Block filter wait failed, polling for receipt: {e}")
+            return None
+        finally:
+            try:
+                make_request('eth_uninstallFilter', [filter_id])
+            except Exception:
+                pass
+    
     def get_transaction_receipt(self, tx_hash: str) -> Optional[dict]:
         """
         Get transaction receipt.
@@ -898,7 +1882,7 @@ class BlockchainClient:
             Cost in native token
         """
         try:
-            gas_price = self.w3.eth.gas_price
+            gas_price = self._gas_price()
             cost_wei = gas_units * gas_price
             cost = self.w3.from_wei(cost_wei, 'ether')
             return float(cost)
@@ -914,7 +1898,7 @@ class BlockchainClient:
             Gas price in Gwei
         """
         try:
-            gas_price_wei = self.w3.eth.gas_price
+            gas_price_wei = self._gas_price()
             gas_price_gwei = self.w3.from_wei(gas_price_wei, 'gwei')
             return float(gas_price_gwei)
         except Exception as e:
@@ -935,6 +1919,111 @@ class BlockchainClient:
         balance = self.get_native_balance(address)
         return balance >= min_balance
     
+    def _gas_price(self, ttl: float = None) -> int:
+        """
+        Get legacy gas price, reusing a recent value within the TTL.
+        
+        Args:
+            ttl: Cache lifetime in seconds (default: chain's fee_cache_ttl)
+            
+        Returns:
+            Gas price in wei
+        """
+        if ttl is None:
+            ttl = self._fee_cache_ttl
+        cached = self._gas_price_cache
+        if cached and time.monotonic() - cached[1] < ttl:
+            return cached[0]
+        
+        gas_price = int(self._rpc('eth_gasPrice', []), 16)
+        self._gas_price_cache = (gas_price, time.monotonic())
+        return gas_price
+    
+    def _get_fee_params(self, ttl: float = None) -> dict:
+        """
+        Get gas fee parameters for a new transaction.
+        
+        Uses EIP-1559 (maxFeePerGas/maxPriorityFeePerGas) if supported,
+        otherwise falls back to legacy gasPrice. Transactions submitted within
+        the TTL share the same fee lookup.
+        
+        Args:
+            ttl: Cache lifetime in seconds (default: chain's fee_cache_ttl)
+            
+        Returns:
+            Dict of gas fee fields to merge into a transaction
+        """
+        if ttl is None:
+            ttl = self._fee_cache_ttl
+        cached = self._fee_cache
+        if cached and time.monotonic() - cached[1] < ttl:
+            return dict(cached[0])
+        
+        try:
+            # Chains known not to support EIP-1559 skip the block lookup entirely
+            if self._supports_1559 is False:
+                return self._make_fee_params(None, None, self._gas_price(ttl))
+            
+            # Latest block header (without transactions) for baseFeePerGas
+            latest_block = self._rpc('eth_getBlockByNumber', ['latest', False])
+            base_fee = latest_block.get('baseFeePerGas')
+            self._supports_1559 = base_fee is not None
+            
+            if base_fee is not None:
+                # Get max priority fee (tip to miner)
+                try:
+                    max_priority_fee = int(self._rpc('eth_maxPriorityFeePerGas', []), 16)
+                except:
+                    max_priority_fee = None
+                return self._make_fee_params(int(base_fee, 16), max_priority_fee)
+            
+            # Legacy transaction
+            return self._make_fee_params(None, None, self._gas_price(ttl))
+            
+        except Exception as e:
+            logger.warning(f"Error building EIP-1559 transaction, falling back to legacy: {e}")
+            # Fallback to legacy gas price
+            return {'gasPrice': self._gas_price(ttl)}
+    
+    def _make_fee_params(self, base_fee: Optional[int], max_priority_fee: Optional[int],
+                         gas_price: Optional[int] = None) -> dict:
+        """
+        Build gas fee parameters from chain data and store them in the fee cache.
+        
+        Args:
+            base_fee: Latest block baseFeePerGas, or None if EIP-1559 is not supported
+            max_priority_fee: Suggested priority fee, or None to use the 1 Gwei fallback
+            gas_price: Legacy gas price (used when base_fee is None)
+            
+        Returns:
+            Dict of gas fee fields to merge into a transaction
+        """
+        if base_fee is not None:
+            # EIP-1559 transaction
+            if max_priority_fee is None:
+                # Fallback priority fee (1 Gwei)
+                max_priority_fee = self.w3.to_wei(1, 'gwei')
+            
+            # Calculate maxFeePerGas: base fee * 2 + priority fee
+            # Multiplying by 2 gives buffer for base fee increases
+            max_fee_per_gas = (base_fee * 2) + max_priority_fee
+            
+            logger.debug(f"Using EIP-1559: maxFee={max_fee_per_gas}, priorityFee={max_priority_fee}, baseFee={base_fee}")
+            fee_params = {
+                'type': 2,
+                'maxFeePerGas': max_fee_per_gas,
+                'maxPriorityFeePerGas': max_priority_fee
+            }
+        else:
+            # Legacy transaction
+            if gas_price is None:
+                gas_price = self._gas_price()
+            logger.debug(f"Using legacy gas: gasPrice={gas_price}")
+            fee_params = {'gasPrice': gas_price}
+        
+        self._fee_cache = (fee_params, time.monotonic())
+        return dict(fee_params)
+    
     def build_eip1559_transaction(self, base_transaction: dict) -> dict:
         """
         Build transaction with EIP-1559 gas parameters.
@@ -948,44 +2037,156 @@ class BlockchainClient:
         Returns:
             Transaction dict with appropriate gas parameters
         """
+        base_transaction.update(self._get_fee_params())
+        return base_transaction
+    
+    def _preflight(self, address: str, transaction: dict = None,
+                   gas_buffer: float = 1.2, gas_fallback: int = None) -> tuple[int, dict, Optional[int]]:
+        """
+        Fetch nonce, gas fee parameters and gas estimate before sending a transaction.
+        
+        Whatever is not already cached goes out in a single JSON-RPC batch; if the
+        batch fails, the calls are made concurrently on the worker pool instead.
+        
+        Args:
+            address: Sender address
+            transaction: Transaction to estimate gas for (without nonce/gas fields), or None
+            gas_buffer: Multiplier applied to the gas estimate
+            gas_fallback: Gas limit to use if estimation fails (None to re-raise the error)
+            
+        Returns:
+            Tuple of (nonce, fee_params, gas_limit); gas_limit is None if no transaction was given
+        """
         try:
-            # Try to get latest block to check if EIP-1559 is supported
-            latest_block = self.w3.eth.get_block('latest')
+            gas_result = self._preflight_batch(address, transaction)
+        except Exception as e:
+            if not self._preflight_batch_warned:
+                logger.warning(f"Batched preflight failed, using concurrent requests: {e}")
+                self._preflight_batch_warned = True
+            return self._preflight_threaded(address, transaction, gas_buffer, gas_fallback)
+        
+        nonce = self.get_nonce(address)
+        fee_params = self._get_fee_params()
+        
+        gas_limit = None
+        if transaction:
+            if isinstance(gas_result, Exception):
+                # A balance revert would also fail on chain; don't send it with the fallback
+                if gas_fallback is None or self._is_balance_error(gas_result):
+                    raise gas_result
+                logger.warning(f"Failed to estimate gas, using fallback {gas_fallback}: {gas_result}")
+                gas_limit = gas_fallback
+            else:
+                gas_limit = int(gas_result * gas_buffer)
+        
+        return nonce, fee_params, gas_limit
+    
+    def _preflight_batch(self, address: str, transaction: dict = None) -> Any:
+        """
+        Prime the nonce and fee caches and estimate gas in one JSON-RPC batch.
+        
+        Only calls whose results aren't cached are included: the pending nonce
+        (first use of the address), the latest block, priority fee and gas price
+        (stale fee cache), and eth_estimateGas (if a transaction is given).
+        
+        Args:
+            address: Checksum sender address
+            transaction: Transaction to estimate gas for, or None
             
-            # Check if baseFeePerGas exists (EIP-1559 support)
-            if 'baseFeePerGas' in latest_block:
-                # EIP-1559 transaction
-                base_fee = latest_block['baseFeePerGas']
-                
-                # Get max priority fee (tip to miner)
-                try:
-                    max_priority_fee = self.w3.eth.max_priority_fee
-                except:
-                    # Fallback priority fee (1 Gwei)
-                    max_priority_fee = self.w3.to_wei(1, 'gwei')
-                
-                # Calculate maxFeePerGas: base fee * 2 + priority fee
-                # Multiplying by 2 gives buffer for base fee increases
-                max_fee_per_gas = (base_fee * 2) + max_priority_fee
-                
-                base_transaction['maxFeePerGas'] = max_fee_per_gas
-                base_transaction['maxPriorityFeePerGas'] = max_priority_fee
-                
-                logger.debug(f"Using EIP-1559: maxFee={max_fee_per_gas}, priorityFee={max_priority_fee}, baseFee={base_fee}")
+        Returns:
+            Gas estimate (int), the estimation error (Exception), or None if no transaction
+        """
+        calls = []
+        need_nonce = not self.nonces.is_synced(address)
+        if need_nonce:
+            calls.append(('eth_getTransactionCount', [address, 'pending']))
+        
+        cached_fees = self._fee_cache
+        need_fees = not (cached_fees and time.monotonic() - cached_fees[1] < self._fee_cache_ttl)
+        # Chains known not to support EIP-1559 only need the gas price
+        legacy_fees = self._supports_1559 is False
+        if need_fees:
+            if not legacy_fees:
+                calls.append(('eth_getBlockByNumber', ['latest', False]))
+                calls.append(('eth_maxPriorityFeePerGas', []))
+            calls.append(('eth_gasPrice', []))
+        
+        if transaction:
+            call_params = {key: transaction[key] for key in ('from', 'to', 'data') if key in transaction}
+            if transaction.get('value'):
+                call_params['value'] = hex(transaction['value'])
+            calls.append(('eth_estimateGas', [call_params]))
+        
+        if not calls:
+            return None
+        
+        results = iter(self._rpc_batch(calls, return_errors=True))
+        
+        if need_nonce:
+            nonce = next(results)
+            if isinstance(nonce, Exception) or nonce is None:
+                raise ValueError(f"Failed to fetch nonce for {address}: {nonce}")
+            self.nonces.seed(address, int(nonce, 16))
+        
+        if need_fees:
+            if legacy_fees:
+                block, priority_fee = {}, None
             else:
-                # Legacy transaction
-                gas_price = self.w3.eth.gas_price
-                base_transaction['gasPrice'] = gas_price
-                logger.debug(f"Using legacy gas: gasPrice={gas_price}")
+                block, priority_fee = next(results), next(results)
+                if not isinstance(block, dict):
+                    raise ValueError(f"Failed to fetch latest block: {block}")
+            gas_price = next(results)
             
-            return base_transaction
+            base_fee = block.get('baseFeePerGas')
+            if not legacy_fees:
+                self._supports_1559 = base_fee is not None
+            priority_fee = int(priority_fee, 16) if isinstance(priority_fee, str) else None
+            gas_price = int(gas_price, 16) if isinstance(gas_price, str) else None
+            if gas_price is not None:
+                self._gas_price_cache = (gas_price, time.monotonic())
+            self._make_fee_params(int(base_fee, 16) if base_fee else None, priority_fee, gas_price)
+        
+        if transaction:
+            gas_estimate = next(results)
+            if isinstance(gas_estimate, Exception):
+                return gas_estimate
+            if gas_estimate is None:
+                return ValueError("Gas estimation returned no result")
+            return int(gas_estimate, 16)
+        
+        return None
+    
+    def _preflight_threaded(self, address: str, transaction: dict = None,
+                            gas_buffer: float = 1.2, gas_fallback: int = None) -> tuple[int, dict, Optional[int]]:
+        """
+        Fetch nonce, gas fee parameters and gas estimate concurrently on the worker pool.
+        
+        Args:
+            address: Sender address
+            transaction: Transaction to estimate gas for (without nonce/gas fields), or None
+            gas_buffer: Multiplier applied to the gas estimate
+            gas_fallback: Gas limit to use if estimation fails (None to re-raise the error)
             
-        except Exception as e:
-            logger.warning(f"Error building EIP-1559 transaction, falling back to legacy: {e}")
-            # Fallback to legacy gas price
-            base_transaction['gasPrice'] = self.w3.eth.gas_price
-            return base_transaction
-
+        Returns:
+            Tuple of (nonce, fee_params, gas_limit); gas_limit is None if no transaction was given
+        """
+        fee_future = self._executor.submit(self._get_fee_params)
+        gas_future = self._executor.submit(self.w3.eth.estimate_gas, transaction) if transaction else None
+        
+        nonce = self.get_nonce(address)
+        fee_params = fee_future.result()
+        
+        gas_limit = None
+        if gas_future is not None:
+            try:
+                gas_limit = int(gas_future.result() * gas_buffer)
+            except Exception as e:
+                if gas_fallback is None or self._is_balance_error(e):
+                    raise
+                logger.warning(f"Failed to estimate gas, using fallback {gas_fallback}: {e}")
+                gas_limit = gas_fallback
+        
+        return nonce, fee_params, gas_limit
 
 def create_blockchain_client(config) -> BlockchainClient:
     """
@@ -999,5 +2200,6 @@ def create_blockchain_client(config) -> BlockchainClient:
     """
     rpc_url = config.get_rpc_url()
     chain_config = config.get_chain_config()
+    ws_url = config.get_ws_url()
     
-    return BlockchainClient(rpc_url, chain_config, config=config)
+    return BlockchainClient(rpc_url, chain_config, config=config, ws_url=ws_url)
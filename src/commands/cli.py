@@ -1,9 +1,12 @@
 """
 CLI commands for DCA Trading Bot.
 """
+import asyncio
 import logging
+from collections import defaultdict
 from utils.logger import setup_logging
 from config import load_config
+from trade_manager import MIN_SWEEP_AMOUNT
 
 logger = logging.getLogger(__name__)
 
@@ -81,8 +84,18 @@ async def sweep_command(args):
     
     logger.info("Starting wallet sweep...")
     
+    # Probe every wallet's USDC in one batch; only wallets worth sweeping
+    # go through the per-wallet transfer path
+    wallets = bot.db.get_wallets_grouped_by_status(bot.config.blockchain, ('active',))['active']
+    balances = bot.blockchain.get_balances_batch([w['address'] for w in wallets])
+    usdc_address = bot.blockchain.usdc_address
+    addresses = [
+        address for address, balance in balances.items()
+        if balance[usdc_address] >= MIN_SWEEP_AMOUNT
+    ]
+    
     # Sweep all USDC to vault
-    result = bot.trade_manager.sweep_wallets_to_vault(dry_run=args.dry_run)
+    result = bot.trade_manager.sweep_wallets_to_vault(dry_run=args.dry_run, addresses=addresses)
     
     print("\n" + "=" * 60)
     print("SWEEP SUMMARY")
@@ -112,10 +125,26 @@ async def collect_eth_command(args):
     
     logger.info(f"Starting {native_token} collection from wallets with USDC < ${min_usdc_threshold:.2f}...")
     
+    # Probe USDC and native balances of every wallet in one batch; only wallets
+    # with low USDC and enough native token to cover gas are visited
+    wallets_by_status = bot.db.get_wallets_grouped_by_status(bot.config.blockchain)
+    balances = bot.blockchain.get_balances_batch(
+        [w['address'] for wallets in wallets_by_status.values() for w in wallets]
+    )
+    usdc_address = bot.blockchain.usdc_address
+    gas_cost_estimate = bot.config.get_gas_cost_estimate()
+    addresses = [
+        address for address, balance in balances.items()
+        if balance[usdc_address] < min_usdc_threshold and balance['native'] > gas_cost_estimate
+    ]
+    skipped_usdc = sum(1 for balance in balances.values() if balance[usdc_address] >= min_usdc_threshold)
+    
     # Collect native tokens from wallets with low USDC balance
     result = bot.wallet_manager.collect_abandoned_wallets_native_token(
         dry_run=args.dry_run,
-        min_usdc_threshold=min_usdc_threshold
+        min_usdc_threshold=min_usdc_threshold,
+        addresses=addresses,
+        skipped_usdc=skipped_usdc
     )
     
     print("\n" + "=" * 60)
@@ -183,12 +212,29 @@ async def wallets_command(args):
     
     bot = _get_trading_bot(config_path=args.config)
     
-    # Get all wallets
-    all_wallets = bot.db.get_active_wallets(bot.config.blockchain)
-    pending_wallets = bot.db.get_wallets_by_status(bot.config.blockchain, 'pending_funding')
-    abandoned_wallets = bot.db.get_wallets_by_status(bot.config.blockchain, 'abandoned')
+    # Get all wallets (one query; keys aren't needed for display)
+    wallets_by_status = bot.db.get_wallets_grouped_by_status(bot.config.blockchain)
+    all_wallets = wallets_by_status['active']
+    pending_wallets = wallets_by_status['pending_funding']
+    abandoned_wallets = wallets_by_status['abandoned']
     
     native_token = bot.blockchain.chain_config.get('native_token', 'ETH')
+    usdc_address = bot.blockchain.usdc_address
+    
+    # Fetch native + USDC balances for every displayed wallet (and the vault)
+    # in batched JSON-RPC requests instead of one round-trip per lookup
+    # (pending orders and positions are loaded from the database meanwhile)
+    if args.abandoned_only:
+        addresses = [w['address'] for w in abandoned_wallets]
+        balances = bot.blockchain.get_balances_batch(addresses)
+    else:
+        addresses = [w['address'] for w in all_wallets + pending_wallets] + [bot.config.vault_address]
+        balances, all_pending_orders, all_positions = await asyncio.gather(
+            asyncio.to_thread(bot.blockchain.get_balances_batch, addresses),
+            asyncio.to_thread(bot.db.get_pending_orders),
+            asyncio.to_thread(bot.db.get_all_positions)
+        )
+        all_positions = {pos['wallet_address']: pos for pos in all_positions}
     
     # If --abandoned-only flag is set, only show abandoned wallets
     if args.abandoned_only:
@@ -210,9 +256,9 @@ async def wallets_command(args):
                 stock = wallet['assigned_stock']
                 loss_count = wallet['loss_count']
                 
-                # Get current balances
-                usdc_balance = bot.blockchain.get_usdc_balance(address)
-                native_balance = bot.blockchain.get_native_balance(address)
+                # Current balances (prefetched)
+                usdc_balance = balances[address][usdc_address]
+                native_balance = balances[address]['native']
                 
                 total_usdc += usdc_balance
                 total_native += native_balance
@@ -246,9 +292,16 @@ async def wallets_command(args):
         total_usdc = 0.0
         total_native = 0.0
         
-        # Get all pending orders and positions upfront (more efficient)
-        all_pending_orders = bot.db.get_pending_orders()
-        all_positions = {pos['wallet_address']: pos for pos in bot.db.get_all_positions()}
+        # Group pending orders by wallet and side, and total them, in one pass
+        # instead of scanning the full order list for every wallet
+        orders_by_wallet = defaultdict(lambda: {'buy': [], 'sell': []})
+        order_totals = defaultdict(lambda: {'buy': [0.0, 0.0], 'sell': [0.0, 0.0]})  # [usdc, quantity]
+        for order in all_pending_orders:
+            address, side = order['wallet_address'], order['order_type']
+            orders_by_wallet[address][side].append(order)
+            totals = order_totals[address][side]
+            totals[0] += order['amount_usdc']
+            totals[1] += order['quantity']
         
         for i, wallet in enumerate(all_wallets, 1):
             address = wallet['address']
@@ -256,16 +309,20 @@ async def wallets_command(args):
             loss_count = wallet['loss_count']
             
             # Get pending orders for this wallet
-            pending_orders = [o for o in all_pending_orders if o['wallet_address'] == address]
-            pending_buy_orders = [o for o in pending_orders if o['order_type'] == 'buy']
-            pending_sell_orders = [o for o in pending_orders if o['order_type'] == 'sell']
+            wallet_orders = orders_by_wallet[address]
+            pending_buy_orders = wallet_orders['buy']
+            pending_sell_orders = wallet_orders['sell']
+            
+            # Order totals (accumulated while grouping)
+            buy_usdc_total, buy_qty_total = order_totals[address]['buy']
+            sell_usdc_total, sell_qty_total = order_totals[address]['sell']
             
             # Calculate USDC value from pending buy orders
-            usdc_value = sum(o['amount_usdc'] for o in pending_buy_orders)
+            usdc_value = buy_usdc_total
             total_usdc += usdc_value
             
-            # Get native balance (still need to query for gas info)
-            native_balance = bot.blockchain.get_native_balance(address)
+            # Native balance for gas info (prefetched)
+            native_balance = balances[address]['native']
             total_native += native_balance
             
             # Get active position from database
@@ -274,7 +331,7 @@ async def wallets_command(args):
             if position:
                 stock_ticker = position['stock_ticker']
                 # Calculate available stock quantity (subtract pending sell orders)
-                pending_sell_quantity = sum(o['quantity'] for o in pending_sell_orders)
+                pending_sell_quantity = sell_qty_total
                 available_quantity = max(0.0, position['quantity'] - pending_sell_quantity)
                 position_info = f" | Position: {available_quantity:.4f} {stock_ticker}"
                 if pending_sell_quantity > 0:
@@ -283,12 +340,8 @@ async def wallets_command(args):
             # Format order info
             order_info = ""
             if pending_buy_orders:
-                buy_usdc_total = sum(o['amount_usdc'] for o in pending_buy_orders)
-                buy_qty_total = sum(o['quantity'] for o in pending_buy_orders)
                 order_info += f" | {len(pending_buy_orders)} buy order(s): ${buy_usdc_total:.2f} USDC / {buy_qty_total:.4f} shares"
             if pending_sell_orders:
-                sell_qty_total = sum(o['quantity'] for o in pending_sell_orders)
-                sell_usdc_total = sum(o['amount_usdc'] for o in pending_sell_orders)
                 order_info += f" | {len(pending_sell_orders)} sell order(s): {sell_qty_total:.4f} shares / ${sell_usdc_total:.2f} USDC"
             
             print(f"\n{i}. {address}")
@@ -307,9 +360,9 @@ async def wallets_command(args):
             address = wallet['address']
             stock = wallet['assigned_stock']
             
-            # Get current balances
-            usdc_balance = bot.blockchain.get_usdc_balance(address)
-            native_balance = bot.blockchain.get_native_balance(address)
+            # Current balances (prefetched)
+            usdc_balance = balances[address][usdc_address]
+            native_balance = balances[address]['native']
             
             print(f"\n{i}. {address}")
             print(f"   Stock: {stock}")
@@ -329,8 +382,8 @@ async def wallets_command(args):
     # Vault information
     print("\n💰 VAULT")
     print("-" * 80)
-    vault_usdc = bot.blockchain.get_usdc_balance(bot.config.vault_address)
-    vault_native = bot.blockchain.get_native_balance(bot.config.vault_address)
+    vault_usdc = balances[bot.config.vault_address][usdc_address]
+    vault_native = balances[bot.config.vault_address]['native']
     print(f"Address: {bot.config.vault_address}")
     print(f"Balance: ${vault_usdc:.2f} USDC | {vault_native:.6f} {native_token}")
     
@@ -3,23 +3,126 @@ Configuration management module.
 Loads settings from config.yaml and environment variables.
 """
 
+import json
 import os
-import yaml
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Set once .env has been loaded into the environment
+_ENV_LOADED = False
+
+
+def _ensure_env_loaded():
+    """
+    Load environment variables from .env (once per process).
+    
+    Skipped when DCA_SKIP_DOTENV=1, for deployments that provide the variables
+    directly; python-dotenv is then never imported.
+    """
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    
+    if os.environ.get('DCA_SKIP_DOTENV') == '1':
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _load_yaml(path: str) -> Any:
+    """
+    Parse a YAML file with the fastest available safe loader.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML data
+    """
+    import yaml
+    
+    # libyaml-backed loader when available (C parser), pure-Python otherwise
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    
+    with open(path, 'rb') as f:
+        return yaml.load(f.read(), Loader=loader)
+
+
+def _load_yaml_cached(path: str) -> Any:
+    """
+    Load a YAML file through a JSON sidecar cache (<file>.cache).
+    
+    The cache stores the source file's mtime and size; it is reused only while
+    both still match, otherwise the YAML is reparsed and the cache rewritten
+    atomically. JSON is used so that loading the cache can never run code;
+    data that doesn't survive a JSON round trip (e.g. non-string keys) is not
+    cached. Cache read/write failures fall back to plain parsing.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML data
+    """
+    path = os.fspath(path)
+    cache_path = path + '.cache'
+    st = os.stat(path)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+        if cached['mtime_ns'] == st.st_mtime_ns and cached['size'] == st.st_size:
+            return cached['data']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+    
+    data = _load_yaml(path)
+    
+    try:
+        encoded = json.dumps({'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'data': data})
+        if json.loads(encoded)['data'] != data:
+            logger.debug(f"Not caching {path}: contents don't round-trip through JSON")
+            return data
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(encoded)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+    
+    return data
+
 
 class Config:
     """Main configuration class."""
     
+    # Every attribute assigned by the loaders below; main.py also sets
+    # mint_address/burn_address, which are listed here.
+    __slots__ = (
+        'config_path', 'chains_path', '_config_path_str', '_chains_path_str',
+        'chains', 'blockchain',
+        'trading_stocks', 'stock_filter', '_stock_filter_set',
+        'max_usd_per_wallet', 'min_usd_per_wallet', 'gas_per_wallet',
+        'min_profit', 'max_hold_days', 'max_loss_traders', 'sell_slippage',
+        'order_expiry_days', 'liquid_mode', 'dry_run',
+        'check_interval_seconds', 'portfolio_cache_refresh', 'reload_config',
+        'sharesdao_api_url', 'alchemy_api_key', 'database_encryption_key',
+        'vault_private_key', '_vault_address_cached',
+        'mint_address', 'burn_address', '_cached_mint', '_cached_burn',
+        '_token_addr_by_ticker', '_tickers', '_chain_cfg_cache', '_rpc_url_cache',
+        '_file_stamps',
+    )
+    
     def __init__(self, config_path: str = None):
         """
         Initialize configuration.
@@ -34,39 +137,59 @@ class Config:
         
         self.config_path = Path(config_path)
         self.chains_path = self.config_path.parent / "chains.yaml"
+        # Plain string paths for the loaders and the reload stat checks
+        self._config_path_str = os.fspath(self.config_path)
+        self._chains_path_str = os.fspath(self.chains_path)
+        
+        # Per-blockchain lookups (cleared when chains.yaml is reloaded)
+        self._chain_cfg_cache: Dict[str, Dict[str, Any]] = {}
+        self._rpc_url_cache: Dict[str, str] = {}
         
         # Load configurations
-        self._load_config()
-        self._load_chains()
+        _ensure_env_loaded()
+        config, chains = self._parse_files()
+        self._load_config(config)
+        self._load_chains(chains)
         self._load_env()
         
-    def _load_config(self):
-        """Load main configuration from config.yaml."""
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # (mtime_ns, size) of both files as loaded, for reload_if_changed()
+        self._file_stamps = self._stat_files()
+        
+    def _load_config(self, config: Dict[str, Any] = None):
+        """
+        Load main configuration from config.yaml.
+        
+        Args:
+            config: Already parsed config.yaml contents (parsed from disk if None)
+        """
+        if config is None:
+            config = _load_yaml_cached(self._config_path_str)
+        
+        get = config.get
         
         # Blockchain
-        self.blockchain = config.get('blockchain', 'arbitrum')
+        self.blockchain = get('blockchain', 'arbitrum')
         
         # Pool addresses (will be populated from API)
-        pool = config.get('pool', {})
-        self.mint_address = pool.get('mint_address', '')
-        self.burn_address = pool.get('burn_address', '')
+        # Each section is looked up once; "or {}" also covers empty sections
+        pool_get = (get('pool') or {}).get
+        self.mint_address = pool_get('mint_address', '')
+        self.burn_address = pool_get('burn_address', '')
         
         # Trading parameters
-        trading = config.get('trading', {})
-        self.max_usd_per_wallet = trading.get('max_usd_per_wallet', 100)
-        self.min_usd_per_wallet = trading.get('min_usd_per_wallet', 10)
-        self.gas_per_wallet = trading.get('gas_per_wallet', 0.002)
-        self.order_expiry_days = trading.get('order_expiry_days', 7)
-        self.min_profit = trading.get('min_profit', 5)
-        self.max_hold_days = trading.get('max_hold_days', 30)
-        self.max_loss_traders = trading.get('max_loss_traders', 3)
-        self.sell_slippage = trading.get('sell_slippage', 0.005)  # Default 0.5%
+        trading_get = (get('trading') or {}).get
+        self.max_usd_per_wallet = trading_get('max_usd_per_wallet', 100)
+        self.min_usd_per_wallet = trading_get('min_usd_per_wallet', 10)
+        self.gas_per_wallet = trading_get('gas_per_wallet', 0.002)
+        self.order_expiry_days = trading_get('order_expiry_days', 7)
+        self.min_profit = trading_get('min_profit', 5)
+        self.max_hold_days = trading_get('max_hold_days', 30)
+        self.max_loss_traders = trading_get('max_loss_traders', 3)
+        self.sell_slippage = trading_get('sell_slippage', 0.005)  # Default 0.5%
         
         # Pools filter (optional list of pool tickers to trade)
         # Can be a list of tickers or empty list to use all available pools
-        stocks_config = config.get('stocks', [])
+        stocks_config = get('stocks', [])
         if isinstance(stocks_config, list):
             self.stock_filter = stocks_config  # List of pool tickers to filter, or empty for all
         elif isinstance(stocks_config, dict):
@@ -74,25 +197,113 @@ class Config:
             self.stock_filter = list(stocks_config.keys())
         else:
             self.stock_filter = []
+        self._stock_filter_set = frozenset(self.stock_filter)
         
         # Actual trading pools will be populated from SharesDAO API
-        self.trading_stocks = {}  # Maps ticker to pool info
+        self.trading_stocks = MappingProxyType({})  # Maps ticker to pool info
+        self._index_trading_stocks()
         
         # Monitoring
-        monitoring = config.get('monitoring', {})
-        self.check_interval_seconds = monitoring.get('check_interval_seconds', 300)
-        self.portfolio_cache_refresh = monitoring.get('portfolio_cache_refresh', 3)
+        monitoring_get = (get('monitoring') or {}).get
+        self.check_interval_seconds = monitoring_get('check_interval_seconds', 300)
+        self.portfolio_cache_refresh = monitoring_get('portfolio_cache_refresh', 3)
+        self.reload_config = monitoring_get('reload_config', False)
         
         # Dry-run mode
-        self.dry_run = config.get('dry_run', False)
+        self.dry_run = get('dry_run', False)
         
         # Liquidation mode
-        self.liquid_mode = config.get('liquid_mode', False)
+        self.liquid_mode = get('liquid_mode', False)
         
-    def _load_chains(self):
-        """Load chain configurations from chains.yaml."""
-        with open(self.chains_path, 'r') as f:
-            self.chains = yaml.safe_load(f)
+    def _load_chains(self, chains: Dict[str, Any] = None):
+        """
+        Load chain configurations from chains.yaml.
+        
+        Args:
+            chains: Already parsed chains.yaml contents (parsed from disk if None)
+        """
+        if chains is None:
+            chains = _load_yaml_cached(self._chains_path_str)
+        
+        # Read-only views: get_chain_config() hands out the shared per-chain mapping
+        self.chains = MappingProxyType({
+            name: MappingProxyType(chain) if isinstance(chain, dict) else chain
+            for name, chain in chains.items()
+        })
+    
+    def _parse_files(self) -> tuple:
+        """
+        Parse config.yaml and chains.yaml concurrently.
+        
+        The two files are independent and the libyaml parser releases the GIL,
+        so reading and parsing them on two threads overlaps the work.
+        
+        Returns:
+            Tuple of (config, chains) parsed contents
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            config_future = executor.submit(_load_yaml_cached, self._config_path_str)
+            chains_future = executor.submit(_load_yaml_cached, self._chains_path_str)
+            return config_future.result(), chains_future.result()
+    
+    def _stat_files(self) -> tuple:
+        """
+        Get the modification stamps of config.yaml and chains.yaml.
+        
+        Returns:
+            Tuple of (mtime_ns, size) pairs, one per file
+        """
+        stamps = []
+        for path in (self._config_path_str, self._chains_path_str):
+            st = os.stat(path)
+            stamps.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload config.yaml and chains.yaml if either changed on disk.
+        
+        Both files are parsed before any setting is replaced, so a file that
+        fails to parse leaves the current configuration untouched. Trading pools
+        (set from the API) and the mint/burn addresses taken from them are kept,
+        and the blockchain can't change at runtime.
+        Chain settings already handed to a blockchain client are not updated.
+        
+        Returns:
+            True if the configuration was reloaded
+        """
+        try:
+            stamps = self._stat_files()
+            if stamps == self._file_stamps:
+                return False
+            config, chains = self._parse_files()
+        except Exception as e:
+            logger.error(f"Config reload failed, keeping current settings: {e}")
+            return False
+        
+        blockchain = self.blockchain
+        trading_stocks = self.trading_stocks
+        mint_address = self.mint_address
+        burn_address = self.burn_address
+        
+        self._load_config(config)
+        self._load_chains(chains)
+        
+        if self.blockchain != blockchain:
+            logger.warning(f"Ignoring blockchain change to {self.blockchain}; restart the bot to switch chains")
+            self.blockchain = blockchain
+        
+        self._chain_cfg_cache.clear()
+        self._rpc_url_cache.clear()
+        self._prime_rpc_url()
+        self.trading_stocks = trading_stocks
+        self.mint_address = mint_address
+        self.burn_address = burn_address
+        self._index_trading_stocks()
+        self._file_stamps = stamps
+        
+        logger.info("Configuration reloaded from disk")
+        return True
     
     def _load_env(self):
         """Load sensitive data from environment variables."""
@@ -103,8 +314,27 @@ class Config:
         # SharesDAO API
         self.sharesdao_api_url = os.getenv('SHARESDAO_API_URL', 'https://api.sharesdao.com:8443')
         
-        # Derive vault address from private key
-        self.vault_address = self._derive_address_from_private_key(self.vault_private_key)
+        # Vault address is derived from the private key on first access
+        self._vault_address_cached = None
+        
+        self._prime_rpc_url()
+    
+    def _prime_rpc_url(self):
+        """Build and cache the RPC URL of the configured blockchain up front."""
+        if not self.alchemy_api_key:
+            return
+        try:
+            self.get_rpc_url()
+        except ValueError as e:
+            # Reported again when the URL is actually requested
+            logger.debug(f"RPC URL not precomputed: {e}")
+    
+    @property
+    def vault_address(self) -> str:
+        """Vault address derived from VAULT_PRIVATE_KEY (computed once, on first use)."""
+        if self._vault_address_cached is None:
+            self._vault_address_cached = self._derive_address_from_private_key(self.vault_private_key)
+        return self._vault_address_cached
     
     def _derive_address_from_private_key(self, private_key: str) -> str:
         """
@@ -133,7 +363,7 @@ class Config:
             logger.error(f"Failed to derive address from private key: {e}")
             return None
     
-    def get_chain_config(self, blockchain: str = None) -> Dict[str, Any]:
+    def get_chain_config(self, blockchain: str = None) -> Mapping[str, Any]:
         """
         Get configuration for a specific blockchain.
         
@@ -141,12 +371,19 @@ class Config:
             blockchain: Blockchain name (default: current blockchain from config)
             
         Returns:
-            Chain configuration dictionary
+            Chain configuration (read-only mapping)
         """
         chain = blockchain or self.blockchain
+        cached = self._chain_cfg_cache.get(chain)
+        if cached is not None:
+            return cached
+        
         if chain not in self.chains:
             raise ValueError(f"Unknown blockchain: {chain}")
-        return self.chains[chain]
+        
+        chain_config = self.chains[chain]
+        self._chain_cfg_cache[chain] = chain_config
+        return chain_config
     
     def get_gas_cost_estimate(self, blockchain: str = None) -> float:
         """
@@ -173,6 +410,10 @@ class Config:
             RPC URL string
         """
         chain = blockchain or self.blockchain
+        cached = self._rpc_url_cache.get(chain)
+        if cached is not None:
+            return cached
+        
         chain_config = self.get_chain_config(chain)
         
         # Use Alchemy for all supported chains
@@ -183,7 +424,33 @@ class Config:
         if not self.alchemy_api_key:
             raise ValueError("ALCHEMY_API_KEY not set in environment variables")
         
-        return f"https://{alchemy_network}.g.alchemy.com/v2/{self.alchemy_api_key}"
+        rpc_url = f"https://{alchemy_network}.g.alchemy.com/v2/{self.alchemy_api_key}"
+        self._rpc_url_cache[chain] = rpc_url
+        return rpc_url
+    
+    def get_ws_url(self, blockchain: str = None) -> str:
+        """
+        Get WebSocket RPC URL for a specific blockchain.
+        
+        Uses 'ws_url' from chains.yaml if set, otherwise derives the Alchemy
+        WebSocket endpoint when 'use_websocket' is enabled for the chain.
+        
+        Args:
+            blockchain: Blockchain name (default: current blockchain from config)
+            
+        Returns:
+            WebSocket URL string, or None if WebSocket is not configured
+        """
+        chain_config = self.get_chain_config(blockchain)
+        
+        if chain_config.get('ws_url'):
+            return chain_config['ws_url']
+        
+        alchemy_network = chain_config.get('alchemy_network')
+        if chain_config.get('use_websocket') and alchemy_network and self.alchemy_api_key:
+            return f"wss://{alchemy_network}.g.alchemy.com/v2/{self.alchemy_api_key}"
+        
+        return None
     
     def validate(self) -> List[str]:
         """
@@ -232,12 +499,37 @@ class Config:
         """
         # Apply filter if specified
         if self.stock_filter:
-            filtered_stocks = {k: v for k, v in stocks.items() if k in self.stock_filter}
-            self.trading_stocks = filtered_stocks
+            matched = self._stock_filter_set & stocks.keys()
+            # Keep the order the pools are listed in config.yaml
+            filtered_stocks = {k: stocks[k] for k in self.stock_filter if k in matched}
+            missing = self._stock_filter_set - matched
+            if missing:
+                logger.warning(f"Configured pools not available from API: {', '.join(sorted(missing))}")
+            self.trading_stocks = MappingProxyType(filtered_stocks)
             logger.info(f"Filtered pools: {len(filtered_stocks)} out of {len(stocks)}")
         else:
-            self.trading_stocks = stocks
+            self.trading_stocks = MappingProxyType(dict(stocks))
             logger.info(f"Using all available pools: {len(stocks)}")
+        
+        self._index_trading_stocks()
+    
+    def _index_trading_stocks(self):
+        """Precompute mint/burn addresses, the ticker tuple and the ticker -> token address map."""
+        if self.trading_stocks:
+            # All pools share the same mint/burn addresses; take them from the first
+            first_pool = next(iter(self.trading_stocks.values()))
+            self._cached_mint = first_pool.get('mint_address', self.mint_address)
+            self._cached_burn = first_pool.get('burn_address', self.burn_address)
+        else:
+            self._cached_mint = self.mint_address
+            self._cached_burn = self.burn_address
+        
+        self._token_addr_by_ticker = {
+            ticker: pool['asset_id']
+            for ticker, pool in self.trading_stocks.items()
+            if pool.get('asset_id')
+        }
+        self._tickers = tuple(self.trading_stocks)
     
     def get_pool_by_ticker(self, ticker: str) -> Dict[str, Any]:
         """
@@ -264,23 +556,21 @@ class Config:
         Raises:
             ValueError: If ticker not found or no token address
         """
-        if ticker not in self.trading_stocks:
-            raise ValueError(f"Unknown pool ticker: {ticker}")
-        
-        token_address = self.trading_stocks[ticker].get('asset_id')
-        if not token_address:
-            raise ValueError(f"No token address for pool {ticker}")
-        
-        return token_address
+        try:
+            return self._token_addr_by_ticker[ticker]
+        except KeyError:
+            if ticker not in self.trading_stocks:
+                raise ValueError(f"Unknown pool ticker: {ticker}") from None
+            raise ValueError(f"No token address for pool {ticker}") from None
     
-    def get_stock_tickers(self) -> list:
+    def get_stock_tickers(self) -> tuple:
         """
-        Get list of available pool tickers.
+        Get available pool tickers.
         
         Returns:
-            List of pool ticker symbols
+            Tuple of pool ticker symbols (shared; computed when pools are set)
         """
-        return list(self.trading_stocks.keys())
+        return self._tickers
     
     def get_mint_address(self) -> str:
         """
@@ -290,10 +580,7 @@ class Config:
         Returns:
             Mint address from first pool (same for all pools)
         """
-        if self.trading_stocks:
-            first_pool = next(iter(self.trading_stocks.values()))
-            return first_pool.get('mint_address', self.mint_address)
-        return self.mint_address
+        return self._cached_mint
     
     def get_burn_address(self) -> str:
         """
@@ -303,10 +590,7 @@ class Config:
         Returns:
             Burn address from first pool (same for all pools)
         """
-        if self.trading_stocks:
-            first_pool = next(iter(self.trading_stocks.values()))
-            return first_pool.get('burn_address', self.burn_address)
-        return self.burn_address
+        return self._cached_burn
     
     def __repr__(self):
         """String representation of config."""
@@ -3,16 +3,225 @@ Database management module.
 Handles SQLite database operations with encrypted private key storage.
 """
 
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import queue
 import sqlite3
 import logging
+import multiprocessing
+import threading
+import time
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from cryptography.fernet import Fernet
+from typing import Optional, List, Dict, Any, Union
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Applied once when the shared connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",       # 64 MiB page cache
+    "PRAGMA mmap_size = 268435456",     # 256 MiB memory-mapped I/O
+)
+
+# Table definitions ({table} is the table name, so migrations can build a copy).
+# wallets and positions are keyed lookups by address: WITHOUT ROWID stores each
+# row in the primary key B-tree itself, so a lookup is a single descent.
+_TABLE_SCHEMAS = {
+    'wallets': """
+        CREATE TABLE IF NOT EXISTS {table} (
+            address TEXT PRIMARY KEY,
+            private_key_encrypted BLOB NOT NULL,
+            blockchain TEXT NOT NULL,
+            assigned_stock TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'active',
+            loss_count INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            last_trade_at TIMESTAMP
+        ) WITHOUT ROWID
+    """,
+    'orders': """
+        CREATE TABLE IF NOT EXISTS {table} (
+            order_id TEXT PRIMARY KEY,
+            wallet_address TEXT NOT NULL,
+            order_type TEXT NOT NULL,
+            stock_ticker TEXT NOT NULL,
+            amount_usdc REAL NOT NULL,
+            quantity REAL NOT NULL,
+            limit_price REAL NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            profit_loss REAL,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            filled_at TIMESTAMP,
+            expires_at TIMESTAMP NOT NULL,
+            FOREIGN KEY (wallet_address) REFERENCES wallets(address) ON DELETE CASCADE
+        )
+    """,
+    'positions': """
+        CREATE TABLE IF NOT EXISTS {table} (
+            wallet_address TEXT PRIMARY KEY,
+            stock_ticker TEXT NOT NULL,
+            quantity REAL NOT NULL,
+            avg_buy_price REAL NOT NULL,
+            total_cost_usdc REAL NOT NULL,
+            first_buy_date DATE NOT NULL,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (wallet_address) REFERENCES wallets(address) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    """,
+}
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Compiled-statement cache size of the shared connection (sqlite3 default: 128)
+_CACHED_STATEMENTS = 256
+
+# Read-only connections kept for concurrent reads (WAL allows readers alongside the writer)
+_MAX_READERS = min(8, os.cpu_count() or 4)
+
+# Bulk key decryption moves to a process pool above this many tokens; starting
+# the workers costs far more than decrypting a few thousand keys in-process
+_PARALLEL_DECRYPT_THRESHOLD = 50000
+_DECRYPT_CHUNK_SIZE = 5000
+
+# Fixed statements, kept as module constants so the connection's statement
+# cache (keyed on the SQL string) reuses the compiled form
+_SQL_INSERT_WALLET = """
+    INSERT INTO wallets (address, private_key_encrypted, blockchain, assigned_stock, status)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_WALLET_IF_ABSENT = _SQL_INSERT_WALLET + "    ON CONFLICT(address) DO NOTHING\n"
+_SQL_SELECT_WALLET = "SELECT * FROM wallets WHERE address = ?"
+_SQL_SELECT_PRIVATE_KEY = "SELECT private_key_encrypted FROM wallets WHERE address = ?"
+_SQL_SELECT_ACTIVE_WALLETS = "SELECT * FROM wallets WHERE status = 'active'"
+_SQL_SELECT_ACTIVE_WALLETS_ON_CHAIN = "SELECT * FROM wallets WHERE status = 'active' AND blockchain = ?"
+_SQL_SELECT_WALLETS_BY_STATUS = "SELECT * FROM wallets WHERE status = ? AND blockchain = ?"
+
+# Wallet columns without the encrypted private key, for listings
+_WALLET_COLUMNS = "address, blockchain, assigned_stock, status, loss_count, created_at, last_trade_at"
+_SQL_LIST_ACTIVE_WALLETS = f"SELECT {_WALLET_COLUMNS} FROM wallets WHERE status = 'active'"
+_SQL_LIST_ACTIVE_WALLETS_ON_CHAIN = f"SELECT {_WALLET_COLUMNS} FROM wallets WHERE status = 'active' AND blockchain = ?"
+_SQL_LIST_WALLETS_BY_STATUS = f"SELECT {_WALLET_COLUMNS} FROM wallets WHERE status = ? AND blockchain = ?"
+_SQL_UPDATE_WALLET_STATUS = "UPDATE wallets SET status = ? WHERE address = ?"
+_SQL_INCREMENT_LOSS_COUNT = "UPDATE wallets SET loss_count = loss_count + 1 WHERE address = ?"
+_SQL_INCREMENT_LOSS_COUNT_RETURNING = _SQL_INCREMENT_LOSS_COUNT + " RETURNING loss_count"
+_SQL_SELECT_LOSS_COUNT = "SELECT loss_count FROM wallets WHERE address = ?"
+_SQL_RESET_LOSS_COUNT = "UPDATE wallets SET loss_count = 0 WHERE address = ?"
+_SQL_UPDATE_WALLET_STOCK = "UPDATE wallets SET assigned_stock = ? WHERE address = ?"
+_SQL_DELETE_WALLET = "DELETE FROM wallets WHERE address = ?"
+
+_SQL_INSERT_ORDER = """
+    INSERT INTO orders 
+    (order_id, wallet_address, order_type, stock_ticker, amount_usdc, 
+     quantity, limit_price, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_ORDER_STATUS = """
+    UPDATE orders 
+    SET status = ?, filled_at = ?, profit_loss = ?
+    WHERE order_id = ?
+"""
+_SQL_UPDATE_ORDER_STATUS_AND_QUANTITY = """
+    UPDATE orders 
+    SET status = ?, filled_at = ?, profit_loss = ?, quantity = ?
+    WHERE order_id = ?
+"""
+_SQL_SELECT_PENDING_ORDERS = "SELECT * FROM orders WHERE status = 'pending'"
+# Range scan over the partial idx_orders_pending index
+_SQL_SELECT_PENDING_ORDERS_EXPIRING = """
+    SELECT * FROM orders
+    WHERE status = 'pending' AND expires_at <= ?
+    ORDER BY expires_at
+"""
+_SQL_SELECT_WALLET_ORDERS = "SELECT * FROM orders WHERE wallet_address = ? ORDER BY created_at DESC"
+
+_SQL_SELECT_POSITION = "SELECT * FROM positions WHERE wallet_address = ?"
+# On conflict first_buy_date is NOT updated - it should remain the original buy date
+_SQL_UPSERT_POSITION = """
+    INSERT INTO positions 
+    (wallet_address, stock_ticker, quantity, avg_buy_price, 
+     total_cost_usdc, first_buy_date)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(wallet_address) DO UPDATE SET
+        quantity = excluded.quantity,
+        avg_buy_price = excluded.avg_buy_price,
+        total_cost_usdc = excluded.total_cost_usdc,
+        updated_at = CURRENT_TIMESTAMP
+"""
+_SQL_SELECT_OPEN_POSITIONS = "SELECT * FROM positions WHERE quantity > 0"
+_SQL_DELETE_POSITION = "DELETE FROM positions WHERE wallet_address = ?"
+
+
+def _decrypt_tokens(tokens: List[Union[bytes, str]], signing_key: bytes, aes_key: bytes) -> List[str]:
+    """
+    Decrypt Fernet tokens (binary or base64) with the raw HMAC/AES primitives.
+    
+    Args:
+        tokens: Encrypted private keys
+        signing_key: First half of the Fernet key (HMAC-SHA256)
+        aes_key: Second half of the Fernet key (AES-128-CBC)
+        
+    Returns:
+        Plain text private keys, in the same order
+        
+    Raises:
+        InvalidToken: If a token is malformed or fails authentication
+    """
+    aes = algorithms.AES(aes_key)
+    sha256 = hashlib.sha256
+    
+    plain_keys = []
+    for token in tokens:
+        if isinstance(token, str):
+            try:
+                data = base64.urlsafe_b64decode(token)
+            except (binascii.Error, ValueError):
+                raise InvalidToken
+        else:
+            data = token
+        
+        # version (1) | timestamp (8) | IV (16) | ciphertext | HMAC-SHA256 (32)
+        if len(data) < 73 or data[0] != 0x80:
+            raise InvalidToken
+        if not hmac.compare_digest(hmac.new(signing_key, data[:-32], sha256).digest(), data[-32:]):
+            raise InvalidToken
+        
+        decryptor = Cipher(aes, modes.CBC(data[9:25])).decryptor()
+        padded = decryptor.update(data[25:-32]) + decryptor.finalize()
+        
+        # PKCS7 unpadding
+        pad = padded[-1]
+        if not 1 <= pad <= 16 or padded[-pad:] != bytes((pad,)) * pad:
+            raise InvalidToken
+        plain_keys.append(padded[:-pad].decode())
+    
+    return plain_keys
+
+
+# Key halves of a decryption worker process (set by _init_decrypt_worker)
+_worker_keys: Optional[tuple] = None
+
+
+def _init_decrypt_worker(signing_key: bytes, aes_key: bytes):
+    """Store the Fernet key halves in a decryption worker process."""
+    global _worker_keys
+    _worker_keys = (signing_key, aes_key)
+
+
+def _decrypt_chunk(tokens: List[Union[bytes, str]]) -> List[str]:
+    """Decrypt a chunk of tokens in a worker process."""
+    return _decrypt_tokens(tokens, *_worker_keys)
+
 
 class Database:
     """SQLite database manager with encryption support."""
@@ -38,111 +247,269 @@ class Database:
         
         self.cipher = Fernet(encryption_key.encode())
         
-        # Initialize database schema
+        # Raw Fernet key halves for the binary token format (validated by Fernet above)
+        raw_key = base64.urlsafe_b64decode(encryption_key)
+        self._fernet_signing_key = raw_key[:16]
+        self._fernet_aes_key = raw_key[16:]
+        
+        # One long-lived writer connection shared by all threads; the lock
+        # serializes access and transactions are managed explicitly (autocommit mode)
+        self._lock = threading.RLock()
+        self._conn = self._open_connection()
+        
+        # Read-only connections, opened on demand up to _MAX_READERS
+        self._idle_readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(_MAX_READERS)
+        
+        # Initialize database schema (table rebuilds need foreign keys off)
         self._init_schema()
+        self._conn.execute("PRAGMA foreign_keys = ON")
+    
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a connection to the database with the shared PRAGMAs applied.
+        
+        Args:
+            read_only: Reject writes on this connection (PRAGMA query_only)
+            
+        Returns:
+            sqlite3.Connection in autocommit mode
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+    
+    @contextmanager
+    def get_reader(self):
+        """
+        Context manager for a read-only connection from the reader pool.
+        
+        Each statement sees the latest committed data; reads don't wait for
+        the writer. Blocks while all readers are in use.
+        
+        Yields:
+            sqlite3.Connection
+        """
+        with self._reader_slots:
+            try:
+                conn = self._idle_readers.get_nowait()
+            except queue.Empty:
+                conn = self._open_connection(read_only=True)
+            try:
+                yield conn
+            except Exception as e:
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                self._idle_readers.put(conn)
     
     @contextmanager
     def get_connection(self):
         """
-        Context manager for database connections.
+        Context manager for a transaction on the shared connection.
+        
+        Commits on success and rolls back on error. Nested use from the same
+        thread joins the enclosing transaction.
         
         Yields:
             sqlite3.Connection
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            conn = self._conn
+            if conn.in_transaction:
+                yield conn
+                return
+            
+            conn.execute("BEGIN")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.error(f"Database error: {e}")
+                raise
+    
+    def close(self):
+        """Close all connections."""
+        with self._lock:
+            self._conn.close()
+        while True:
+            try:
+                self._idle_readers.get_nowait().close()
+            except queue.Empty:
+                break
     
     def _init_schema(self):
         """Create database tables if they don't exist."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Wallets table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS wallets (
-                    address TEXT PRIMARY KEY,
-                    private_key_encrypted TEXT NOT NULL,
-                    blockchain TEXT NOT NULL,
-                    assigned_stock TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'active',
-                    loss_count INTEGER NOT NULL DEFAULT 0,
-                    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    last_trade_at TIMESTAMP
-                )
-            """)
-            
-            # Orders table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS orders (
-                    order_id TEXT PRIMARY KEY,
-                    wallet_address TEXT NOT NULL,
-                    order_type TEXT NOT NULL,
-                    stock_ticker TEXT NOT NULL,
-                    amount_usdc REAL NOT NULL,
-                    quantity REAL NOT NULL,
-                    limit_price REAL NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'pending',
-                    profit_loss REAL,
-                    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    filled_at TIMESTAMP,
-                    expires_at TIMESTAMP NOT NULL,
-                    FOREIGN KEY (wallet_address) REFERENCES wallets(address)
-                )
-            """)
-            
-            # Positions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS positions (
-                    wallet_address TEXT PRIMARY KEY,
-                    stock_ticker TEXT NOT NULL,
-                    quantity REAL NOT NULL,
-                    avg_buy_price REAL NOT NULL,
-                    total_cost_usdc REAL NOT NULL,
-                    first_buy_date DATE NOT NULL,
-                    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (wallet_address) REFERENCES wallets(address)
-                )
-            """)
+            for table in ('wallets', 'orders', 'positions'):
+                cursor.execute(_TABLE_SCHEMAS[table].format(table=table))
+            
+            # Bring tables created by older versions up to the current definition
+            for table in ('wallets', 'orders', 'positions'):
+                if self._table_outdated(cursor, table):
+                    self._rebuild_table(cursor, table)
+                    logger.info(f"Rebuilt {table} table to the current schema")
             
             # Create indexes
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_wallets_status ON wallets(status)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)")
+            # (status, blockchain) also serves status-only lookups, replacing idx_wallets_status
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_wallets_status_blockchain ON wallets(status, blockchain)")
+            cursor.execute("DROP INDEX IF EXISTS idx_wallets_status")
+            # Orders are only ever looked up by status 'pending'; this partial index
+            # stays as small as the pending set and replaces the full status indexes
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_orders_pending ON orders(expires_at) WHERE status = 'pending'"
+            )
+            cursor.execute("DROP INDEX IF EXISTS idx_orders_status")
+            cursor.execute("DROP INDEX IF EXISTS idx_orders_status_expires")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_wallet ON orders(wallet_address)")
             
+            self._migrate_text_tokens(cursor)
+            
             logger.info("Database schema initialized")
     
-    def encrypt_private_key(self, private_key: str) -> str:
+    def _table_outdated(self, cursor: sqlite3.Cursor, table: str) -> bool:
+        """
+        Check whether a table predates ON DELETE CASCADE or WITHOUT ROWID.
+        
+        Args:
+            cursor: Cursor inside the schema transaction
+            table: Table name
+            
+        Returns:
+            True if the table should be rebuilt
+        """
+        foreign_keys = cursor.execute(f"PRAGMA foreign_key_list({table})").fetchall()
+        if any(fk['on_delete'] != 'CASCADE' for fk in foreign_keys):
+            return True
+        
+        if 'WITHOUT ROWID' in _TABLE_SCHEMAS[table]:
+            sql = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()[0]
+            return 'WITHOUT ROWID' not in sql.upper()
+        
+        return False
+    
+    def _rebuild_table(self, cursor: sqlite3.Cursor, table: str):
+        """
+        Recreate a table from its current definition in _TABLE_SCHEMAS, keeping its rows.
+        
+        Must run with foreign key enforcement off. The table's indexes are
+        dropped with it and recreated by _init_schema.
+        
+        Args:
+            cursor: Cursor inside the schema transaction
+            table: Table name
+        """
+        new_table = f"{table}_rebuild"
+        columns = ', '.join(row['name'] for row in cursor.execute(f"PRAGMA table_info({table})"))
+        
+        cursor.execute(f"DROP TABLE IF EXISTS {new_table}")
+        cursor.execute(_TABLE_SCHEMAS[table].format(table=new_table))
+        cursor.execute(f"INSERT INTO {new_table} ({columns}) SELECT {columns} FROM {table}")
+        cursor.execute(f"DROP TABLE {table}")
+        cursor.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+    
+    def _migrate_text_tokens(self, cursor: sqlite3.Cursor):
+        """
+        Convert private keys stored as base64 Fernet tokens to raw token bytes.
+        
+        Args:
+            cursor: Cursor inside the schema transaction
+        """
+        cursor.execute(
+            "SELECT address, private_key_encrypted FROM wallets "
+            "WHERE typeof(private_key_encrypted) = 'text'"
+        )
+        rows = []
+        for address, token in cursor.fetchall():
+            try:
+                rows.append((base64.urlsafe_b64decode(token), address))
+            except (binascii.Error, ValueError):
+                logger.warning(f"Leaving unreadable private key of {address} as text")
+        
+        if rows:
+            cursor.executemany(
+                "UPDATE wallets SET private_key_encrypted = ? WHERE address = ?", rows
+            )
+            logger.info(f"Converted {len(rows)} stored private keys to binary tokens")
+    
+    def encrypt_private_key(self, private_key: Union[str, bytes]) -> bytes:
         """
         Encrypt a private key.
         
+        The result is a Fernet token in raw binary form (not base64-encoded).
+        
         Args:
-            private_key: Plain text private key
+            private_key: Plain text private key (hex string, or its ASCII bytes)
             
         Returns:
             Encrypted private key
         """
-        return self.cipher.encrypt(private_key.encode()).decode()
+        data = private_key if isinstance(private_key, bytes) else private_key.encode()
+        pad = 16 - len(data) % 16
+        iv = os.urandom(16)
+        
+        encryptor = Cipher(algorithms.AES(self._fernet_aes_key), modes.CBC(iv)).encryptor()
+        ciphertext = encryptor.update(data + bytes((pad,)) * pad) + encryptor.finalize()
+        
+        body = b'\x80' + int(time.time()).to_bytes(8, 'big') + iv + ciphertext
+        return body + hmac.new(self._fernet_signing_key, body, hashlib.sha256).digest()
     
-    def decrypt_private_key(self, encrypted_key: str) -> str:
+    def decrypt_private_key(self, encrypted_key: Union[bytes, str]) -> str:
         """
         Decrypt a private key.
         
         Args:
-            encrypted_key: Encrypted private key
+            encrypted_key: Encrypted private key (binary token, or legacy base64 token)
             
         Returns:
             Plain text private key
         """
-        return self.cipher.decrypt(encrypted_key.encode()).decode()
+        return self._bulk_decrypt([encrypted_key])[0]
+    
+    def _bulk_decrypt(self, tokens: List[Union[bytes, str]]) -> List[str]:
+        """
+        Decrypt many Fernet tokens with the raw HMAC/AES primitives.
+        
+        Tokens are binary, or base64 strings as produced by Fernet itself. No
+        TTL is checked. Batches larger than _PARALLEL_DECRYPT_THRESHOLD are
+        split across a process pool (on multi-core hosts).
+        
+        Args:
+            tokens: Encrypted private keys (Fernet tokens)
+            
+        Returns:
+            Plain text private keys, in the same order
+            
+        Raises:
+            InvalidToken: If a token is malformed or fails authentication
+        """
+        if len(tokens) <= _PARALLEL_DECRYPT_THRESHOLD or (os.cpu_count() or 1) < 2:
+            return _decrypt_tokens(tokens, self._fernet_signing_key, self._fernet_aes_key)
+        
+        chunks = [tokens[i:i + _DECRYPT_CHUNK_SIZE] for i in range(0, len(tokens), _DECRYPT_CHUNK_SIZE)]
+        # spawn: forking would copy this process's threads and locks into the workers
+        with ProcessPoolExecutor(
+            max_workers=min(len(chunks), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_decrypt_worker,
+            initargs=(self._fernet_signing_key, self._fernet_aes_key),
+        ) as executor:
+            return [key for chunk in executor.map(_decrypt_chunk, chunks) for key in chunk]
     
     # Wallet operations
     
@@ -159,17 +526,20 @@ class Database:
             status: Wallet status (default: 'active')
             
         Returns:
-            True if successful
+            True if the wallet was created, False if it already exists or on error
         """
         try:
             encrypted_key = self.encrypt_private_key(private_key)
             
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO wallets (address, private_key_encrypted, blockchain, assigned_stock, status)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (address, encrypted_key, blockchain, assigned_stock, status))
+                created = conn.execute(
+                    _SQL_INSERT_WALLET_IF_ABSENT,
+                    (address, encrypted_key, blockchain, assigned_stock, status)
+                ).rowcount == 1
+            
+            if not created:
+                logger.warning(f"Wallet {address} already exists, not created")
+                return False
             
             logger.info(f"Created wallet {address} for {assigned_stock} on {blockchain}")
             return True
@@ -177,6 +547,37 @@ class Database:
             logger.error(f"Failed to create wallet {address}: {e}")
             return False
     
+    def create_wallets_bulk(self, wallets: List[tuple]) -> bool:
+        """
+        Create several wallet records in one transaction.
+        
+        Private keys are encrypted before the transaction starts; either all
+        rows are inserted or none are.
+        
+        Args:
+            wallets: List of (address, private_key, blockchain, assigned_stock, status) tuples
+            
+        Returns:
+            True if successful
+        """
+        if not wallets:
+            return True
+        
+        try:
+            rows = [
+                (address, self.encrypt_private_key(private_key), blockchain, assigned_stock, status)
+                for address, private_key, blockchain, assigned_stock, status in wallets
+            ]
+            
+            with self.get_connection() as conn:
+                conn.executemany(_SQL_INSERT_WALLET, rows)
+            
+            logger.info(f"Created {len(rows)} wallets")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create {len(wallets)} wallets: {e}")
+            return False
+    
     def get_wallet(self, address: str) -> Optional[Dict[str, Any]]:
         """
         Get wallet by address.
@@ -187,74 +588,137 @@ class Database:
         Returns:
             Wallet dict or None
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM wallets WHERE address = ?", (address,))
-            row = cursor.fetchone()
+        with self.get_reader() as conn:
+            row = conn.execute(_SQL_SELECT_WALLET, (address,)).fetchone()
+        
+        return self._wallet_with_key(row) if row else None
+    
+    def get_private_key(self, address: str) -> Optional[str]:
+        """
+        Get the decrypted private key of a single wallet.
+        
+        Args:
+            address: Wallet address
             
-            if row:
-                wallet = dict(row)
-                wallet['private_key'] = self.decrypt_private_key(wallet['private_key_encrypted'])
-                del wallet['private_key_encrypted']
-                return wallet
-        return None
+        Returns:
+            Plain text private key, or None if the wallet doesn't exist
+        """
+        with self.get_reader() as conn:
+            row = conn.execute(_SQL_SELECT_PRIVATE_KEY, (address,)).fetchone()
+        
+        return self.decrypt_private_key(row[0]) if row else None
     
-    def get_active_wallets(self, blockchain: str = None) -> List[Dict[str, Any]]:
+    def _wallet_with_key(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """
+        Convert a full wallet row to a dict with the private key decrypted.
+        
+        Args:
+            row: Row selected with all wallet columns
+            
+        Returns:
+            Wallet dict with 'private_key' instead of 'private_key_encrypted'
+        """
+        wallet = dict(row)
+        wallet['private_key'] = self.decrypt_private_key(wallet.pop('private_key_encrypted'))
+        return wallet
+    
+    def _wallets_with_keys(self, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+        """
+        Convert full wallet rows to dicts, decrypting all private keys in one batch.
+        
+        Args:
+            rows: Rows selected with all wallet columns
+            
+        Returns:
+            Wallet dicts with 'private_key' instead of 'private_key_encrypted'
+        """
+        wallets = [dict(row) for row in rows]
+        tokens = [wallet.pop('private_key_encrypted') for wallet in wallets]
+        for wallet, private_key in zip(wallets, self._bulk_decrypt(tokens)):
+            wallet['private_key'] = private_key
+        return wallets
+    
+    def get_active_wallets(self, blockchain: str = None,
+                           decrypt_keys: bool = False) -> List[Dict[str, Any]]:
         """
         Get all active wallets.
         
         Args:
             blockchain: Optional blockchain filter
+            decrypt_keys: Include decrypted private keys ('private_key'); otherwise
+                keys are neither selected nor decrypted (see get_private_key)
             
         Returns:
             List of wallet dicts
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
+        if decrypt_keys:
+            sql_all, sql_chain = _SQL_SELECT_ACTIVE_WALLETS, _SQL_SELECT_ACTIVE_WALLETS_ON_CHAIN
+        else:
+            sql_all, sql_chain = _SQL_LIST_ACTIVE_WALLETS, _SQL_LIST_ACTIVE_WALLETS_ON_CHAIN
+        
+        with self.get_reader() as conn:
             if blockchain:
-                cursor.execute(
-                    "SELECT * FROM wallets WHERE status = 'active' AND blockchain = ?",
-                    (blockchain,)
-                )
+                rows = conn.execute(sql_chain, (blockchain,)).fetchall()
             else:
-                cursor.execute("SELECT * FROM wallets WHERE status = 'active'")
-            
-            wallets = []
-            for row in cursor.fetchall():
-                wallet = dict(row)
-                wallet['private_key'] = self.decrypt_private_key(wallet['private_key_encrypted'])
-                del wallet['private_key_encrypted']
-                wallets.append(wallet)
-            
-            return wallets
+                rows = conn.execute(sql_all).fetchall()
+        
+        if decrypt_keys:
+            return self._wallets_with_keys(rows)
+        return [dict(row) for row in rows]
     
-    def get_wallets_by_status(self, blockchain: str, status: str) -> List[Dict[str, Any]]:
+    def get_wallets_by_status(self, blockchain: str, status: str,
+                              decrypt_keys: bool = False) -> List[Dict[str, Any]]:
         """
         Get all wallets with a specific status.
         
         Args:
             blockchain: Blockchain name
             status: Wallet status (e.g., 'pending_funding', 'active', 'abandoned')
+            decrypt_keys: Include decrypted private keys ('private_key'); otherwise
+                keys are neither selected nor decrypted (see get_private_key)
             
         Returns:
             List of wallet dicts
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM wallets WHERE status = ? AND blockchain = ?",
-                (status, blockchain)
+        sql = _SQL_SELECT_WALLETS_BY_STATUS if decrypt_keys else _SQL_LIST_WALLETS_BY_STATUS
+        
+        with self.get_reader() as conn:
+            rows = conn.execute(sql, (status, blockchain)).fetchall()
+        
+        if decrypt_keys:
+            return self._wallets_with_keys(rows)
+        return [dict(row) for row in rows]
+    
+    def get_wallets_grouped_by_status(self, blockchain: str,
+                                      statuses: tuple = ('active', 'pending_funding', 'abandoned')
+                                      ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get wallets for several statuses with a single query, grouped by status.
+        
+        Private keys are not selected (or decrypted); use this for display and
+        balance lookups only.
+        
+        Args:
+            blockchain: Blockchain name
+            statuses: Wallet statuses to include
+            
+        Returns:
+            Dict of {status: [wallet dicts]} with an entry for every requested status
+        """
+        grouped: Dict[str, List[Dict[str, Any]]] = {status: [] for status in statuses}
+        placeholders = ','.join('?' * len(statuses))
+        
+        with self.get_reader() as conn:
+            cursor = conn.execute(
+                f"""SELECT {_WALLET_COLUMNS}
+                    FROM wallets WHERE blockchain = ? AND status IN ({placeholders})""",
+                (blockchain, *statuses)
             )
             
-            wallets = []
             for row in cursor.fetchall():
-                wallet = dict(row)
-                wallet['private_key'] = self.decrypt_private_key(wallet['private_key_encrypted'])
-                del wallet['private_key_encrypted']
-                wallets.append(wallet)
-            
-            return wallets
+                grouped[row['status']].append(dict(row))
+        
+        return grouped
     
     def update_wallet_status(self, address: str, status: str) -> bool:
         """
@@ -269,11 +733,7 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE wallets SET status = ? WHERE address = ?",
-                    (status, address)
-                )
+                conn.execute(_SQL_UPDATE_WALLET_STATUS, (status, address))
             logger.info(f"Updated wallet {address} status to {status}")
             return True
         except Exception as e:
@@ -291,13 +751,11 @@ class Database:
             New loss count
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE wallets SET loss_count = loss_count + 1 WHERE address = ?",
-                (address,)
-            )
-            cursor.execute("SELECT loss_count FROM wallets WHERE address = ?", (address,))
-            return cursor.fetchone()[0]
+            if _HAS_RETURNING:
+                return conn.execute(_SQL_INCREMENT_LOSS_COUNT_RETURNING, (address,)).fetchone()[0]
+            
+            conn.execute(_SQL_INCREMENT_LOSS_COUNT, (address,))
+            return conn.execute(_SQL_SELECT_LOSS_COUNT, (address,)).fetchone()[0]
     
     def reset_loss_count(self, address: str) -> bool:
         """
@@ -311,11 +769,7 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE wallets SET loss_count = 0 WHERE address = ?",
-                    (address,)
-                )
+                conn.execute(_SQL_RESET_LOSS_COUNT, (address,))
             return True
         except Exception as e:
             logger.error(f"Failed to reset loss count for {address}: {e}")
@@ -334,11 +788,7 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE wallets SET assigned_stock = ? WHERE address = ?",
-                    (stock_ticker, address)
-                )
+                conn.execute(_SQL_UPDATE_WALLET_STOCK, (stock_ticker, address))
             logger.info(f"Updated wallet {address} stock to {stock_ticker}")
             return True
         except Exception as e:
@@ -368,14 +818,11 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO orders 
-                    (order_id, wallet_address, order_type, stock_ticker, amount_usdc, 
+                conn.execute(
+                    _SQL_INSERT_ORDER,
+                    (order_id, wallet_address, order_type, stock_ticker, amount_usdc,
                      quantity, limit_price, expires_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (order_id, wallet_address, order_type, stock_ticker, amount_usdc,
-                      quantity, limit_price, expires_at))
+                )
             
             logger.info(f"Created {order_type} order {order_id} for {wallet_address}")
             return True
@@ -383,6 +830,30 @@ class Database:
             logger.error(f"Failed to create order {order_id}: {e}")
             return False
     
+    def create_orders_bulk(self, orders: List[tuple]) -> bool:
+        """
+        Create several order records in one transaction.
+        
+        Args:
+            orders: List of (order_id, wallet_address, order_type, stock_ticker,
+                amount_usdc, quantity, limit_price, expires_at) tuples
+            
+        Returns:
+            True if successful (all orders inserted, or none on error)
+        """
+        if not orders:
+            return True
+        
+        try:
+            with self.get_connection() as conn:
+                conn.executemany(_SQL_INSERT_ORDER, orders)
+            
+            logger.info(f"Created {len(orders)} orders")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create {len(orders)} orders: {e}")
+            return False
+    
     def update_order_status(self, order_id: str, status: str, 
                            filled_at: datetime = None, profit_loss: float = None,
                            quantity: float = None) -> bool:
@@ -401,19 +872,16 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
                 if quantity is not None:
-                    cursor.execute("""
-                        UPDATE orders 
-                        SET status = ?, filled_at = ?, profit_loss = ?, quantity = ?
-                        WHERE order_id = ?
-                    """, (status, filled_at, profit_loss, quantity, order_id))
+                    conn.execute(
+                        _SQL_UPDATE_ORDER_STATUS_AND_QUANTITY,
+                        (status, filled_at, profit_loss, quantity, order_id)
+                    )
                 else:
-                    cursor.execute("""
-                        UPDATE orders 
-                        SET status = ?, filled_at = ?, profit_loss = ?
-                        WHERE order_id = ?
-                    """, (status, filled_at, profit_loss, order_id))
+                    conn.execute(
+                        _SQL_UPDATE_ORDER_STATUS,
+                        (status, filled_at, profit_loss, order_id)
+                    )
             
             logger.info(f"Updated order {order_id} status to {status}")
             return True
@@ -421,19 +889,52 @@ class Database:
             logger.error(f"Failed to update order {order_id}: {e}")
             return False
     
-    def get_pending_orders(self) -> List[Dict[str, Any]]:
+    def get_pending_orders(self) -> List[sqlite3.Row]:
         """
         Get all pending orders.
         
         Returns:
-            List of order dicts
+            List of order rows (read-only, indexable by column name)
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM orders WHERE status = 'pending'")
-            return [dict(row) for row in cursor.fetchall()]
+        with self.get_reader() as conn:
+            return conn.execute(_SQL_SELECT_PENDING_ORDERS).fetchall()
+    
+    def get_pending_orders_expiring_before(self, expires_before: datetime) -> List[sqlite3.Row]:
+        """
+        Get pending orders that expire at or before a given time.
+        
+        Only the matching range of the pending-orders index is visited, so this
+        is cheaper than filtering get_pending_orders() in Python.
+        
+        Args:
+            expires_before: Cutoff expiration datetime (inclusive)
+            
+        Returns:
+            List of order rows ordered by expiration, oldest first
+        """
+        with self.get_reader() as conn:
+            return conn.execute(_SQL_SELECT_PENDING_ORDERS_EXPIRING, (expires_before,)).fetchall()
+    
+    def get_pending_orders_columnar(self) -> Dict[str, List[Any]]:
+        """
+        Get all pending orders as columns instead of per-order dicts.
+        
+        Cheaper than get_pending_orders() for scans and aggregates that only
+        look at a few fields across many orders.
+        
+        Returns:
+            Dict of {column name: list of values}, one entry per orders column
+        """
+        with self.get_reader() as conn:
+            cursor = conn.execute(_SQL_SELECT_PENDING_ORDERS)
+            columns = [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+        
+        if not rows:
+            return {column: [] for column in columns}
+        return {column: list(values) for column, values in zip(columns, zip(*rows))}
     
-    def get_wallet_orders(self, wallet_address: str) -> List[Dict[str, Any]]:
+    def get_wallet_orders(self, wallet_address: str) -> List[sqlite3.Row]:
         """
         Get all orders for a wallet.
         
@@ -441,15 +942,10 @@ class Database:
             wallet_address: Wallet address
             
         Returns:
-            List of order dicts
+            List of order rows (read-only, indexable by column name)
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM orders WHERE wallet_address = ? ORDER BY created_at DESC",
-                (wallet_address,)
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        with self.get_reader() as conn:
+            return conn.execute(_SQL_SELECT_WALLET_ORDERS, (wallet_address,)).fetchall()
     
     # Position operations
     
@@ -471,37 +967,16 @@ class Database:
             True if successful
         """
         try:
+            # first_buy_date only applies when the position is created
+            if first_buy_date is None:
+                first_buy_date = date.today()
+            
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Check if position exists
-                cursor.execute(
-                    "SELECT * FROM positions WHERE wallet_address = ?",
-                    (wallet_address,)
+                conn.execute(
+                    _SQL_UPSERT_POSITION,
+                    (wallet_address, stock_ticker, quantity, avg_buy_price,
+                     total_cost_usdc, first_buy_date)
                 )
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # Update existing position
-                    # Note: first_buy_date is NOT updated - it should remain the original buy date
-                    cursor.execute("""
-                        UPDATE positions 
-                        SET quantity = ?, avg_buy_price = ?, total_cost_usdc = ?, 
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE wallet_address = ?
-                    """, (quantity, avg_buy_price, total_cost_usdc, wallet_address))
-                else:
-                    # Create new position
-                    if first_buy_date is None:
-                        first_buy_date = date.today()
-                    
-                    cursor.execute("""
-                        INSERT INTO positions 
-                        (wallet_address, stock_ticker, quantity, avg_buy_price, 
-                         total_cost_usdc, first_buy_date)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (wallet_address, stock_ticker, quantity, avg_buy_price,
-                          total_cost_usdc, first_buy_date))
             
             logger.info(f"Updated position for {wallet_address}: {quantity} {stock_ticker}")
             return True
@@ -519,23 +994,19 @@ class Database:
         Returns:
             Position dict or None
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM positions WHERE wallet_address = ?", (wallet_address,))
-            row = cursor.fetchone()
+        with self.get_reader() as conn:
+            row = conn.execute(_SQL_SELECT_POSITION, (wallet_address,)).fetchone()
             return dict(row) if row else None
     
-    def get_all_positions(self) -> List[Dict[str, Any]]:
+    def get_all_positions(self) -> List[sqlite3.Row]:
         """
         Get all positions.
         
         Returns:
-            List of position dicts
+            List of position rows (read-only, indexable by column name)
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM positions WHERE quantity > 0")
-            return [dict(row) for row in cursor.fetchall()]
+        with self.get_reader() as conn:
+            return conn.execute(_SQL_SELECT_OPEN_POSITIONS).fetchall()
     
     def delete_wallet(self, address: str) -> bool:
         """
@@ -549,10 +1020,8 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM positions WHERE wallet_address = ?", (address,))
-                cursor.execute("DELETE FROM orders WHERE wallet_address = ?", (address,))
-                cursor.execute("DELETE FROM wallets WHERE address = ?", (address,))
+                # Orders and positions are removed by ON DELETE CASCADE
+                conn.execute(_SQL_DELETE_WALLET, (address,))
             logger.info(f"Deleted wallet {address} and associated records")
             return True
         except Exception as e:
@@ -571,8 +1040,7 @@ class Database:
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM positions WHERE wallet_address = ?", (wallet_address,))
+                conn.execute(_SQL_DELETE_POSITION, (wallet_address,))
             logger.info(f"Deleted position for {wallet_address}")
             return True
         except Exception as e:
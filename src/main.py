@@ -329,6 +329,16 @@ class TradingBot:
             # Get all positions
             all_positions = {pos['wallet_address']: pos for pos in self.db.get_all_positions()}
             
+            # Fetch USDC and stock token balances for all wallets concurrently
+            usdc_address = self.blockchain.usdc_address
+            balance_pairs = []
+            for wallet in active_wallets:
+                balance_pairs.append((usdc_address, wallet['address']))
+                pool_info = self.config.get_pool_by_ticker(wallet['assigned_stock'])
+                if pool_info and pool_info.get('asset_id'):
+                    balance_pairs.append((pool_info['asset_id'], wallet['address']))
+            balances = dict(zip(balance_pairs, self.blockchain.get_balances_parallel(balance_pairs)))
+            
             for wallet in active_wallets:
                 wallet_address = wallet['address']
                 stock_ticker = wallet['assigned_stock']
@@ -343,13 +353,13 @@ class TradingBot:
                 pending_sell_orders = pending_orders['sell']
                 
                 # 1. Get actual token balances in wallet (current holdings)
-                actual_usdc_balance = self.blockchain.get_usdc_balance(wallet_address)
+                actual_usdc_balance = balances[(usdc_address, wallet_address)]
                 pool_info = self.config.get_pool_by_ticker(stock_ticker)
                 actual_stock_balance = 0.0
                 if pool_info:
                     token_address = pool_info.get('asset_id')
                     if token_address:
-                        actual_stock_balance = self.blockchain.get_token_balance(token_address, wallet_address)
+                        actual_stock_balance = balances[(token_address, wallet_address)]
                 
                 # 2. Calculate value from actual balances
                 usdc_value = actual_usdc_balance
@@ -491,6 +501,10 @@ class TradingBot:
                 iteration += 1
                 logger.info(f"--- Iteration {iteration} ---")
                 
+                # Pick up edits to config.yaml/chains.yaml between iterations
+                if self.config.reload_config:
+                    self.config.reload_if_changed()
+                
                 # Log total USD value
                 value_info = await self.calculate_total_usd_value()
                 
@@ -535,6 +549,7 @@ class TradingBot:
         except Exception as e:
             logger.error(f"Fatal error: {e}", exc_info=True)
         finally:
+            self.db.close()
             logger.info("Trading bot stopped")
 
 
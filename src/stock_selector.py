@@ -5,6 +5,7 @@ Handles random stock assignment to wallets.
 
 import random
 import logging
+from collections.abc import Mapping
 from typing import List
 
 logger = logging.getLogger(__name__)
@@ -20,7 +21,7 @@ class StockSelector:
         Args:
             available_stocks: List of available stock tickers or dict with stock info
         """
-        if isinstance(available_stocks, dict):
+        if isinstance(available_stocks, Mapping):
             self.available_stocks = list(available_stocks.keys())
         else:
             self.available_stocks = available_stocks
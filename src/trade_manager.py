@@ -6,10 +6,13 @@ Handles buy/sell orders via blockchain transactions, position monitoring, and P/
 import logging
 import time
 from datetime import datetime, timedelta, date
+from collections import Counter
 from typing import Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+MIN_SWEEP_AMOUNT = 0.01  # Minimum USDC to sweep (avoid dust)
+
 
 class TradeManager:
     """Manages trading operations via on-chain order submission."""
@@ -115,7 +118,7 @@ class TradeManager:
                 usdc_amount=usdc_amount,
                 stock_quantity=quantity_at_limit,
                 customer_id=customer_id,
-                mint_address=self.config.mint_address,
+                mint_address=self.config.get_mint_address(),
                 expiry_days=self.config.order_expiry_days,
                 order_type='LIMIT',  # Always use LIMIT for buy orders
                 dry_run=dry_run
@@ -125,10 +128,11 @@ class TradeManager:
                 logger.error(f"Failed to submit buy order for {wallet_address}")
                 return None
             
-            # Save order to database
+            # Save order to database before returning; the transaction is already sent,
+            # so this record is what confirmation and refund monitoring work from
             expires_at = datetime.now() + timedelta(days=self.config.order_expiry_days)
             
-            self.db.create_order(
+            created = self.db.create_order(
                 order_id=customer_id,
                 wallet_address=wallet_address,
                 order_type='buy',
@@ -139,6 +143,10 @@ class TradeManager:
                 expires_at=expires_at
             )
             
+            if not created:
+                logger.error(f"Buy order {customer_id} was sent (tx: {tx_hash}) but could not be recorded; reconcile it manually")
+                return None
+            
             logger.info(f"Buy order placed: {customer_id}, tx: {tx_hash}")
             return customer_id
             
@@ -253,7 +261,7 @@ class TradeManager:
                 stock_quantity=quantity,
                 usdc_amount=usdc_amount,
                 customer_id=customer_id,
-                burn_address=self.config.burn_address,
+                burn_address=self.config.get_burn_address(),
                 expiry_days=self.config.order_expiry_days,
                 order_type=order_type,
                 dry_run=dry_run
@@ -263,10 +271,11 @@ class TradeManager:
                 logger.error(f"Failed to submit sell order for {wallet_address}")
                 return None
             
-            # Save order to database
+            # Save order to database before returning; the transaction is already sent,
+            # so this record is what confirmation and refund monitoring work from
             expires_at = datetime.now() + timedelta(days=self.config.order_expiry_days)
             
-            self.db.create_order(
+            created = self.db.create_order(
                 order_id=customer_id,
                 wallet_address=wallet_address,
                 order_type='sell',
@@ -277,6 +286,10 @@ class TradeManager:
                 expires_at=expires_at
             )
             
+            if not created:
+                logger.error(f"Sell order {customer_id} was sent (tx: {tx_hash}) but could not be recorded; reconcile it manually")
+                return None
+            
             logger.info(f"Sell order placed: {customer_id}, tx: {tx_hash}")
             return customer_id
             
@@ -396,16 +409,18 @@ class TradeManager:
         native_token = self.blockchain.chain_config.get('native_token', 'ETH')
         MIN_STOCK_BALANCE = 0.0001  # Minimum stock tokens to consider as having stocks
         
+        # Pending order count per wallet (one query for all wallets)
+        pending_counts = Counter(self.db.get_pending_orders_columnar()['wallet_address'])
+        
         for wallet in active_wallets:
             wallet_address = wallet['address']
             
             try:
                 # Check if wallet has any pending orders
-                pending_orders = self.db.get_pending_orders()
-                wallet_pending_orders = [o for o in pending_orders if o['wallet_address'] == wallet_address]
+                pending_count = pending_counts[wallet_address]
                 
-                if wallet_pending_orders:
-                    logger.debug(f"{wallet_address}: has {len(wallet_pending_orders)} pending order(s), skipping")
+                if pending_count:
+                    logger.debug(f"{wallet_address}: has {pending_count} pending order(s), skipping")
                     continue
                 
                 # Check if wallet has any stock tokens
@@ -913,13 +928,16 @@ class TradeManager:
         
         return summary
     
-    def sweep_wallets_to_vault(self, dry_run: bool = False) -> Dict[str, Any]:
+    def sweep_wallets_to_vault(self, dry_run: bool = False,
+                               addresses: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Sweep all USDC from all wallets back to vault.
         Should be called after liquidate_all_positions and orders are confirmed.
         
         Args:
             dry_run: If True, simulate only
+            addresses: Optional pre-filtered wallet addresses (e.g. from a batched
+                balance probe); other wallets are counted as checked but skipped
             
         Returns:
             Dict with sweep summary
@@ -945,9 +963,14 @@ class TradeManager:
         wallets_swept = 0
         total_usdc_swept = 0.0
         errors = []
-        MIN_SWEEP_AMOUNT = 0.01  # Minimum USDC to sweep (avoid dust)
         
-        for wallet in all_wallets:
+        # Only visit wallets the caller's balance probe selected
+        wallets_to_sweep = all_wallets
+        if addresses is not None:
+            selected = set(addresses)
+            wallets_to_sweep = [w for w in all_wallets if w['address'] in selected]
+        
+        for wallet in wallets_to_sweep:
             wallet_address = wallet['address']
             
             try:
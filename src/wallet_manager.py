@@ -201,7 +201,7 @@ class WalletManager:
         success_count = 0
         for wallet in pending_wallets:
             address = wallet['address']
-            private_key = wallet['private_key']
+            private_key = self.db.get_private_key(address)
             assigned_stock = wallet['assigned_stock']
             
             # Use a default funding amount (could also store this in DB)
@@ -502,7 +502,9 @@ class WalletManager:
         return summary
     
     def collect_abandoned_wallets_native_token(self, dry_run: bool = False, 
-                                               min_usdc_threshold: float = 1.0) -> Dict[str, Any]:
+                                               min_usdc_threshold: float = 1.0,
+                                               addresses: Optional[List[str]] = None,
+                                               skipped_usdc: int = 0) -> Dict[str, Any]:
         """
         Collect native tokens (ETH/BNB) from wallets with almost zero USDC balance.
         Scans all wallets (active, pending_funding, abandoned) and collects ETH/BNB
@@ -511,6 +513,10 @@ class WalletManager:
         Args:
             dry_run: If True, simulate only
             min_usdc_threshold: Maximum USDC balance to consider wallet as "almost zero" (default: 1.0)
+            addresses: Optional pre-filtered wallet addresses (e.g. from a batched
+                balance probe); other wallets are counted as checked but skipped
+            skipped_usdc: Wallets the caller's probe already dropped for USDC balance
+                >= min_usdc_threshold; included in wallets_skipped_usdc
             
         Returns:
             Dict with summary of collection
@@ -537,14 +543,20 @@ class WalletManager:
         
         native_token = self.blockchain.chain_config.get('native_token', 'ETH')
         wallets_collected = 0
-        wallets_skipped_usdc = 0
+        wallets_skipped_usdc = skipped_usdc
         total_collected = 0.0
         errors = []
         
         # Gas cost estimate for native token transfer (get from chain config)
         gas_cost_estimate = self.config.get_gas_cost_estimate()
         
-        for wallet in all_wallets:
+        # Only visit wallets the caller's balance probe selected
+        wallets_to_check = all_wallets
+        if addresses is not None:
+            selected = set(addresses)
+            wallets_to_check = [w for w in all_wallets if w['address'] in selected]
+        
+        for wallet in wallets_to_check:
             wallet_address = wallet['address']
             wallet_status = wallet.get('status', 'active')
             
@@ -574,7 +586,7 @@ class WalletManager:
                 
                 # Transfer native token to vault
                 tx_hash = self.blockchain.transfer_native_token(
-                    wallet['private_key'],
+                    self.db.get_private_key(wallet_address),
                     self.config.vault_address,
                     amount_to_return,
                     dry_run=dry_run